@@ -1,22 +1,161 @@
+import asyncio
+import json
+import random
+import time
+from collections import deque
 import httpx
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Optional
 from fastapi import HTTPException
 
 from app.core.config import settings
+from app.ai.response_cache import ai_response_cache
 
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class ClientMetrics:
+    """
+    Per-call latency and outcome counters for the AI provider.
+    """
+
+    def __init__(self, window: int = 500):
+        self.calls = 0
+        self.failures = 0
+        self.retries = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.in_flight = 0
+        self.streams = 0
+        self._recent = deque(maxlen=window)
+        self._ttft = deque(maxlen=window)
+
+    def record(self, latency: float, ok: bool) -> None:
+        self.calls += 1
+        if not ok:
+            self.failures += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self._recent.append(latency)
+
+    def record_ttft(self, seconds: float) -> None:
+        self.streams += 1
+        self._ttft.append(seconds)
+
+    @staticmethod
+    def _percentile(values, q: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "retries": self.retries,
+            "in_flight": self.in_flight,
+            "avg_latency_ms": round(self.total_latency / self.calls * 1000, 1) if self.calls else 0.0,
+            "p50_latency_ms": round(self._percentile(self._recent, 0.5) * 1000, 1),
+            "p95_latency_ms": round(self._percentile(self._recent, 0.95) * 1000, 1),
+            "max_latency_ms": round(self.max_latency * 1000, 1),
+            "streams": self.streams,
+            "p50_ttft_ms": round(self._percentile(self._ttft, 0.5) * 1000, 1),
+            "p95_ttft_ms": round(self._percentile(self._ttft, 0.95) * 1000, 1),
+        }
 
 
 class ClaudeClient:
     def __init__(self):
         self.api_key = settings.API_KEY
         self.model = settings.MODEL
+        self.url = settings.AI_API_URL
+        self.metrics = ClientMetrics()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Upstream calls currently in flight, keyed by cache key
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def startup(self) -> None:
+        """
+        Creates the long-lived pooled client, called on application startup.
+        """
+        if self._client is not None:
+            return
+
+        self._client = httpx.AsyncClient(
+            http2=settings.AI_HTTP2,
+            timeout=httpx.Timeout(settings.AI_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=settings.AI_MAX_CONCURRENCY,
+                max_keepalive_connections=settings.AI_MAX_CONCURRENCY,
+                keepalive_expiry=settings.AI_KEEPALIVE_SECONDS,
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(settings.AI_MAX_CONCURRENCY)
+
+    async def shutdown(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _post(self, headers: Dict[str, str], payload: Dict[str, Any]) -> httpx.Response:
+        """
+        POSTs with bounded concurrency, retrying 429/5xx and transport
+        errors with exponential backoff and full jitter.
+        """
+        if self._client is None:
+            await self.startup()
+
+        attempt = 0
+        while True:
+            retry_after = None
+            async with self._semaphore:
+                self.metrics.in_flight += 1
+                started = time.perf_counter()
+                try:
+                    response = await self._client.post(
+                        self.url,
+                        headers=headers,
+                        json=payload,
+                    )
+                except httpx.TransportError:
+                    self.metrics.record(time.perf_counter() - started, ok=False)
+                    if attempt >= settings.AI_MAX_RETRIES:
+                        raise
+                    response = None
+                finally:
+                    self.metrics.in_flight -= 1
+
+            if response is not None:
+                ok = response.status_code < 400
+                self.metrics.record(time.perf_counter() - started, ok=ok)
+                if (
+                    response.status_code not in RETRYABLE_STATUS
+                    or attempt >= settings.AI_MAX_RETRIES
+                ):
+                    return response
+                retry_after = response.headers.get("Retry-After")
+
+            attempt += 1
+            self.metrics.retries += 1
+            await asyncio.sleep(self._backoff(attempt, retry_after))
+
+    @staticmethod
+    def _backoff(attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after:
+            try:
+                return min(float(retry_after), settings.AI_RETRY_MAX_DELAY)
+            except ValueError:
+                pass
+        cap = min(settings.AI_RETRY_BASE_DELAY * (2 ** attempt), settings.AI_RETRY_MAX_DELAY)
+        return random.uniform(0, cap)
 
     async def generate(
         self,
         system_prompt: str,
         user_prompt: str,
         temperature: float = 0.2,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
 
         if not self.api_key:
@@ -25,6 +164,47 @@ class ClaudeClient:
                 "raw": None,
             }
 
+        if not (use_cache and settings.AI_CACHE_ENABLED):
+            response, _ = await self._complete(system_prompt, user_prompt, temperature)
+            return response
+
+        key = ai_response_cache.make_key(
+            self.model, system_prompt, user_prompt, temperature
+        )
+
+        cached = await ai_response_cache.get(key)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        # Single-flight: identical concurrent requests share one upstream call
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._complete_and_store(key, system_prompt, user_prompt, temperature)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _complete_and_store(
+        self,
+        key: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+    ) -> Dict[str, Any]:
+        response, ok = await self._complete(system_prompt, user_prompt, temperature)
+        if ok:
+            await ai_response_cache.put(key, self.model, response)
+        return response
+
+    def _request(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+    ) -> tuple[Dict[str, str], Dict[str, Any]]:
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -40,26 +220,111 @@ class ClaudeClient:
             ],
             "temperature": temperature,
         }
+        return headers, payload
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+    ) -> AsyncIterator[str]:
+        """
+        Yields completion text as the provider streams it. Cached
+        completions are replayed in one piece; a finished stream is
+        stored in the cache like a regular completion.
+        """
+        if not self.api_key:
+            yield "AI insights are temporarily unavailable. Please review the metrics provided."
+            return
+
+        use_cache = settings.AI_CACHE_ENABLED
+        key = ai_response_cache.make_key(
+            self.model, system_prompt, user_prompt, temperature
+        )
+        if use_cache:
+            cached = await ai_response_cache.get(key)
+            if cached is not None:
+                yield cached["content"]
+                return
+
+        if self._client is None:
+            await self.startup()
 
-        async with httpx.AsyncClient(timeout=60) as client:
-            response = await client.post(
-                OPENROUTER_URL,
-                headers=headers,
-                json=payload,
+        headers, payload = self._request(system_prompt, user_prompt, temperature)
+        payload["stream"] = True
+        parts = []
+
+        async with self._semaphore:
+            self.metrics.in_flight += 1
+            started = time.perf_counter()
+            ok = False
+            try:
+                async with self._client.stream(
+                    "POST", self.url, headers=headers, json=payload
+                ) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+                        yield "AI insights could not be generated at this time. Please refer to the calculated metrics."
+                        return
+
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[len("data:"):].strip()
+                        if data == "[DONE]":
+                            break
+
+                        choices = json.loads(data).get("choices") or [{}]
+                        token = (choices[0].get("delta") or {}).get("content")
+                        if not token:
+                            continue
+                        if not parts:
+                            self.metrics.record_ttft(time.perf_counter() - started)
+                        parts.append(token)
+                        yield token
+                ok = True
+            except httpx.TransportError:
+                yield "AI insights could not be generated at this time. Please refer to the calculated metrics."
+                return
+            finally:
+                self.metrics.in_flight -= 1
+                self.metrics.record(time.perf_counter() - started, ok=ok)
+
+        if use_cache and parts:
+            await ai_response_cache.put(
+                key,
+                self.model,
+                {"content": "".join(parts), "raw": None},
             )
 
-            if response.status_code >= 400:
-                return {
-                    "content": "AI insights could not be generated at this time. Please refer to the calculated metrics.",
-                    "raw": response.text,
-                }
+    async def _complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+    ) -> tuple[Dict[str, Any], bool]:
+        headers, payload = self._request(system_prompt, user_prompt, temperature)
+
+        try:
+            response = await self._post(headers, payload)
+        except httpx.TransportError as exc:
+            return {
+                "content": "AI insights could not be generated at this time. Please refer to the calculated metrics.",
+                "raw": str(exc),
+            }, False
+
+        if response.status_code >= 400:
+            return {
+                "content": "AI insights could not be generated at this time. Please refer to the calculated metrics.",
+                "raw": response.text,
+            }, False
 
-            data = response.json()
+        data = response.json()
 
         return {
             "content": data["choices"][0]["message"]["content"],
             "raw": data,
-        }
+        }, True
 
 
 claude_client = ClaudeClient()
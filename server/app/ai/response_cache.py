@@ -0,0 +1,136 @@
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.ai_cache import AIResponseCacheEntry
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Expired and least recently used entries are evicted every this many
+# puts, rather than counting the table on every write
+EVICT_EVERY_PUTS = 50
+
+
+class AIResponseCache:
+    """
+    Content-addressed store for LLM completions in Postgres, with TTL
+    and size-based (least recently used) eviction. The cache is best
+    effort: database errors are logged and treated as a miss, so callers
+    fall through to the provider.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._puts_since_evict = EVICT_EVERY_PUTS
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+    ) -> str:
+        payload = json.dumps(
+            [model, system_prompt, user_prompt, temperature],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = datetime.now(timezone.utc)
+        table = AIResponseCacheEntry.__table__
+
+        try:
+            async with AsyncSessionLocal() as db:
+                response = (await db.execute(
+                    table.update()
+                    .where(table.c.key == key, table.c.expires_at > now)
+                    .values(hit_count=table.c.hit_count + 1, last_accessed_at=now)
+                    .returning(table.c.response)
+                )).scalar()
+                await db.commit()
+        except Exception as exc:
+            self.errors += 1
+            logger.warning("AI response cache lookup failed: %s", exc)
+            response = None
+
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    async def put(self, key: str, model: str, response: Dict[str, Any]) -> None:
+        now = datetime.now(timezone.utc)
+        values = {
+            "key": key,
+            "model": model,
+            "response": response,
+            "hit_count": 0,
+            "created_at": now,
+            "last_accessed_at": now,
+            "expires_at": now + timedelta(seconds=self.ttl_seconds),
+        }
+
+        try:
+            async with AsyncSessionLocal() as db:
+                stmt = pg_insert(AIResponseCacheEntry).values(**values)
+                await db.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[AIResponseCacheEntry.key],
+                        set_={k: stmt.excluded[k] for k in values if k != "key"},
+                    )
+                )
+                self._puts_since_evict += 1
+                if self._puts_since_evict >= EVICT_EVERY_PUTS:
+                    await self._evict(db, now)
+                    self._puts_since_evict = 0
+                await db.commit()
+        except Exception as exc:
+            self.errors += 1
+            logger.warning("AI response cache write failed: %s", exc)
+
+    async def _evict(self, db, now: datetime) -> None:
+        await db.execute(
+            delete(AIResponseCacheEntry).where(AIResponseCacheEntry.expires_at <= now)
+        )
+
+        count = (await db.execute(
+            select(func.count()).select_from(AIResponseCacheEntry)
+        )).scalar()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            oldest = (
+                select(AIResponseCacheEntry.key)
+                .order_by(AIResponseCacheEntry.last_accessed_at)
+                .limit(overflow)
+            )
+            await db.execute(
+                delete(AIResponseCacheEntry).where(AIResponseCacheEntry.key.in_(oldest))
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+ai_response_cache = AIResponseCache(
+    ttl_seconds=settings.AI_CACHE_TTL_SECONDS,
+    max_entries=settings.AI_CACHE_MAX_ENTRIES,
+)
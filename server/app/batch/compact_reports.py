@@ -0,0 +1,25 @@
+"""
+Applies the report retention policy once, outside the app's periodic
+background task (e.g. from cron, or after changing the policy).
+
+    python -m app.batch.compact_reports --keep 20 --daily-days 30
+"""
+import argparse
+
+from app.core.config import settings
+from app.core.database import engine
+from app.services.report_retention import ReportRetention
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--keep", type=int, default=settings.REPORT_RETENTION_KEEP_LATEST)
+    parser.add_argument("--daily-days", type=int, default=settings.REPORT_RETENTION_DAILY_DAYS)
+    parser.add_argument("--batch-users", type=int, default=500)
+    args = parser.parse_args()
+
+    print(ReportRetention.compact(engine, args.keep, args.daily_days, args.batch_users))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Nightly recomputation of metrics, risk, credit score, benchmarks and
+forecasts for every tenant.
+
+    python -m app.batch.recompute --workers 8 --checkpoint /var/lib/sme/recompute.json
+
+financial_data is streamed from Postgres ordered by user_id with a
+server-side cursor, split into per-user frames and fanned out to a
+process pool. Each batch of users is written back as Report rows in one
+executemany insert, after which the checkpoint (last completed user_id)
+is saved so an interrupted run resumes where it stopped.
+"""
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import pandas as pd
+from sqlalchemy import insert, select
+
+from app.core.database import engine
+from app.models.financial_data import FinancialData
+from app.models.report import Report
+from app.models.user import User
+from app.services.benchmarking import BenchmarkingService
+from app.services.data_access import FinancialDataLoader
+from app.services.finance_analysis import FinanceAnalyzer
+from app.services.forecasting import ForecastingService
+from app.services.risk_engine import RiskEngine
+from app.services.working_capital import WorkingCapitalAdvisor
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+COLUMNS = [
+    "user_id",
+    "record_date",
+    "revenue",
+    "expenses",
+    "accounts_receivable",
+    "accounts_payable",
+    "inventory_value",
+    "loan_obligations",
+    "tax_paid",
+]
+
+SUMMARY = "Nightly recomputation"
+
+
+def iter_user_frames(
+    after_user_id: int,
+    chunk_rows: int,
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """
+    Yields (user_id, frame) for every user with id > after_user_id,
+    reading fixed-size partitions and carrying a user's rows over when
+    they span a partition boundary.
+    """
+    stmt = (
+        select(*[getattr(FinancialData, c) for c in COLUMNS])
+        .where(FinancialData.user_id > after_user_id)
+        .order_by(FinancialData.user_id, FinancialData.record_date)
+    )
+
+    with engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True, yield_per=chunk_rows
+        ).execute(stmt)
+
+        pending = None
+        for partition in result.partitions(chunk_rows):
+            frame = FinancialDataLoader.to_frame(partition, COLUMNS)
+            if pending is not None:
+                frame = pd.concat([pending, frame], ignore_index=True)
+
+            last_user = frame["user_id"].iat[-1]
+            complete = frame[frame["user_id"] != last_user]
+            pending = frame[frame["user_id"] == last_user]
+
+            for user_id, user_frame in complete.groupby("user_id", sort=False):
+                yield int(user_id), user_frame
+
+        if pending is not None and not pending.empty:
+            yield int(pending["user_id"].iat[0]), pending
+
+
+def compute_user(args: Tuple[int, str, pd.DataFrame]) -> List[Dict]:
+    """
+    Worker entry point, returns Report rows for one user.
+    """
+    user_id, industry, df = args
+
+    metrics = FinanceAnalyzer.calculate_metrics(df)
+    reports = [{
+        "user_id": user_id,
+        "report_type": "analysis",
+        "summary": SUMMARY,
+        "metrics": metrics,
+        "ai_insights": {
+            "risk": RiskEngine.assess_risk(metrics),
+            "credit_score": RiskEngine.credit_score(metrics),
+            "benchmark": BenchmarkingService.compare(metrics, industry),
+            "benchmark_percentiles": BenchmarkingService.percentile_ranks(metrics, industry),
+            "working_capital_suggestions": WorkingCapitalAdvisor.suggest(metrics),
+        },
+    }]
+
+    details = ForecastingService.forecast(df)
+    if details is not None:
+        forecast = ForecastingService.revenue_by_month(details)
+        reports.append({
+            "user_id": user_id,
+            "report_type": "forecast",
+            "summary": SUMMARY,
+            "metrics": {**forecast, "details": details},
+            "ai_insights": None,
+        })
+
+    return reports
+
+
+def load_checkpoint(path: Path) -> Dict:
+    if path.exists():
+        return json.loads(path.read_text())
+    return {"last_user_id": 0, "users_processed": 0}
+
+
+def save_checkpoint(path: Path, state: Dict) -> None:
+    state["updated_at"] = datetime.now(timezone.utc).isoformat()
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state))
+    tmp.replace(path)  # atomic, a crash never leaves a torn checkpoint
+
+
+def _batched(items: Iterator, size: int) -> Iterator[List]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _industries(user_ids: List[int]) -> Dict[int, str]:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            select(User.id, User.industry).where(User.id.in_(user_ids))
+        ).all()
+    return {user_id: industry or "" for user_id, industry in rows}
+
+
+def run(
+    workers: int,
+    batch_users: int,
+    chunk_rows: int,
+    checkpoint: Path,
+    reset: bool = False,
+) -> Dict:
+    state = {"last_user_id": 0, "users_processed": 0} if reset else load_checkpoint(checkpoint)
+    started = time.perf_counter()
+    processed = 0
+
+    logger.info("Recompute starting after user_id=%s", state["last_user_id"])
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        users = iter_user_frames(state["last_user_id"], chunk_rows)
+        for batch in _batched(users, batch_users):
+            industries = _industries([user_id for user_id, _ in batch])
+            jobs = [(user_id, industries.get(user_id, ""), df) for user_id, df in batch]
+
+            rows = [
+                row
+                for reports in pool.map(compute_user, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+                for row in reports
+            ]
+            with engine.begin() as conn:
+                conn.execute(insert(Report), rows)
+
+            processed += len(batch)
+            state["last_user_id"] = batch[-1][0]
+            state["users_processed"] += len(batch)
+            save_checkpoint(checkpoint, state)
+
+            elapsed = time.perf_counter() - started
+            logger.info(
+                "Recomputed %s users (last user_id=%s), %.1f users/sec",
+                processed, state["last_user_id"], processed / elapsed,
+            )
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "users": processed,
+        "elapsed_seconds": round(elapsed, 2),
+        "users_per_second": round(processed / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+    logger.info("Recompute finished: %s", summary)
+
+    # A finished run starts from the beginning next night
+    save_checkpoint(checkpoint, {"last_user_id": 0, "users_processed": 0})
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-users", type=int, default=500)
+    parser.add_argument("--chunk-rows", type=int, default=50000)
+    parser.add_argument("--checkpoint", type=Path, default=Path("recompute_checkpoint.json"))
+    parser.add_argument("--reset", action="store_true", help="ignore an existing checkpoint")
+    args = parser.parse_args()
+
+    run(args.workers, args.batch_users, args.chunk_rows, args.checkpoint, args.reset)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -20,12 +20,78 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: int
 
+    # Optional record_date range partitioning of financial_data
+    FINANCIAL_DATA_PARTITIONED: bool = False
+    FINANCIAL_DATA_PARTITION_GRANULARITY: str = "year"  # year | quarter
+
     # AI settings
     API_KEY: str
     MODEL: str
+    AI_API_URL: str = "https://openrouter.ai/api/v1/chat/completions"
+    AI_HTTP2: bool = True
+    AI_TIMEOUT_SECONDS: float = 60.0
+    AI_KEEPALIVE_SECONDS: float = 60.0
+    AI_MAX_CONCURRENCY: int = 8
+    AI_MAX_RETRIES: int = 3
+    AI_RETRY_BASE_DELAY: float = 0.5
+    AI_RETRY_MAX_DELAY: float = 10.0
+    AI_CACHE_ENABLED: bool = True
+    AI_CACHE_TTL_SECONDS: int = 86400
+    AI_CACHE_MAX_ENTRIES: int = 10000
+
+    # Analysis settings
+    METRICS_ENGINE: str = "aggregate"  # aggregate | sql
+    ANALYSIS_BATCH_MAX_ROWS: int = 100000
+
+    # Optional JSON file with user-defined expense categorization rules
+    EXPENSE_RULES_FILE: Optional[str] = None
+
+    # Industry benchmarks, defaults to app/data/industry_benchmarks.json
+    BENCHMARK_FILE: Optional[str] = None
+    BENCHMARK_RELOAD_INTERVAL_SECONDS: int = 30
+
+    # Percentile ranks against tenants in the same industry
+    PEER_BENCHMARK_REFRESH_SECONDS: int = 900
+    PEER_BENCHMARK_MIN_POPULATION: int = 5
+
+    # Report cache settings
+    REPORT_CACHE_ENABLED: bool = True
+    REPORT_CACHE_BACKEND: str = "memory"  # memory | dotted path to a CacheBackend
+    REPORT_CACHE_SIZE: int = 1024
+    REPORT_CACHE_TTL_SECONDS: int = 3600
+
+    # Report listing
+    REPORTS_PAGE_SIZE: int = 50
+    REPORTS_MAX_PAGE_SIZE: int = 200
+
+    # Report retention: the newest N per user and type are kept as-is,
+    # older ones are compacted to one per day, then one per month.
+    # Compaction deletes reports, so the background task is opt-in
+    # (python -m app.batch.compact_reports runs it once).
+    REPORT_RETENTION_KEEP_LATEST: int = 20
+    REPORT_RETENTION_DAILY_DAYS: int = 30
+    REPORT_COMPACTION_ENABLED: bool = False
+    REPORT_COMPACTION_INTERVAL_SECONDS: int = 3600
 
     # Upload settings
     MAX_UPLOAD_SIZE_MB: int = 20
+    UPLOAD_BATCH_SIZE: int = 5000
+    UPLOAD_CHUNK_ROWS: int = 50000
+    UPLOAD_WORKERS: int = 2
+    UPLOAD_JOB_EXECUTOR: str = "process"  # process | thread
+    UPLOAD_SPOOL_DIR: str = "/tmp/sme_uploads"
+    UPLOAD_USE_COPY: bool = False
+    UPLOAD_MAX_REPORTED_ERRORS: int = 100
+
+    # Rows per batch when streaming financial data exports
+    EXPORT_BATCH_ROWS: int = 50000
+
+    # PDF statement extraction
+    PDF_WORKERS: int = 4
+    PDF_PARALLEL_MIN_PAGES: int = 20
+    PDF_CACHE_ENABLED: bool = True
+    PDF_CACHE_DIR: str = "/tmp/sme_pdf_cache"
+    PDF_CACHE_MAX_FILES: int = 500
 
     # CORS settings
     ALLOWED_ORIGINS: str
@@ -38,6 +104,14 @@ class Settings(BaseSettings):
             f"{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:"
+            f"{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:"
+            f"{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        )
+
     def cors_origins_list(self) -> List[str]:
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
 
@@ -0,0 +1,77 @@
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
+
+def run_migrations(engine: Engine) -> None:
+    """
+    Applies the ordered *.sql files in server/migrations that have not
+    been recorded in schema_migrations yet. `create_all` only creates
+    missing tables, these cover changes to existing ones.
+    """
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version VARCHAR PRIMARY KEY, "
+            "applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+        ))
+        applied = set(conn.execute(text("SELECT version FROM schema_migrations")).scalars())
+
+    for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+        if path.stem in applied:
+            continue
+        with engine.begin() as conn:
+            conn.exec_driver_sql(path.read_text())
+            conn.execute(
+                text("INSERT INTO schema_migrations (version) VALUES (:v)"),
+                {"v": path.stem},
+            )
+
+    if settings.FINANCIAL_DATA_PARTITIONED:
+        with engine.begin() as conn:
+            ensure_financial_data_partitions(conn)
+
+
+def _partition_bounds(year: int, granularity: str):
+    if granularity == "quarter":
+        for q in range(4):
+            start = f"{year}-{q * 3 + 1:02d}-01"
+            end = f"{year + 1}-01-01" if q == 3 else f"{year}-{q * 3 + 4:02d}-01"
+            yield f"financial_data_y{year}q{q + 1}", start, end
+    else:
+        yield f"financial_data_y{year}", f"{year}-01-01", f"{year + 1}-01-01"
+
+
+def ensure_financial_data_partitions(
+    conn: Connection,
+    years_back: int = 1,
+    years_ahead: int = 1,
+) -> None:
+    """
+    Creates missing record_date range partitions around the current year
+    for the optional partitioned layout (migrations/optional).
+    """
+    current = conn.execute(text("SELECT EXTRACT(YEAR FROM now())::int")).scalar()
+    existing = set(conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'financial_data'::regclass"
+    )).scalars())
+
+    for year in range(current - years_back, current + years_ahead + 1):
+        # A year already covered at another granularity must not overlap
+        if any(name.startswith(f"financial_data_y{year}") for name in existing):
+            continue
+        for name, start, end in _partition_bounds(
+            year, settings.FINANCIAL_DATA_PARTITION_GRANULARITY
+        ):
+            conn.exec_driver_sql(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF financial_data "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
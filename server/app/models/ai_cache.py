@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class AIResponseCacheEntry(Base):
+    __tablename__ = "ai_response_cache"
+
+    key = Column(String(64), primary_key=True)  # sha256 of the request
+    model = Column(String, nullable=False)
+
+    response = Column(JSON, nullable=False)  # {"content": ..., "raw": ...}
+    hit_count = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    last_accessed_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        index=True
+    )
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, Float, Date, ForeignKey, DateTime
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class UserFinancialAggregate(Base):
+    """
+    Running totals of a user's financial_data, maintained at ingestion
+    time so metrics can be computed without rescanning every row.
+    """
+    __tablename__ = "user_financial_aggregates"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+
+    revenue = Column(Float, nullable=False, default=0.0)
+    expenses = Column(Float, nullable=False, default=0.0)
+
+    accounts_receivable = Column(Float, nullable=False, default=0.0)
+    accounts_payable = Column(Float, nullable=False, default=0.0)
+    inventory_value = Column(Float, nullable=False, default=0.0)
+
+    loan_obligations = Column(Float, nullable=False, default=0.0)
+    tax_paid = Column(Float, nullable=False, default=0.0)
+
+    row_count = Column(Integer, nullable=False, default=0)
+    min_date = Column(Date, nullable=True)
+    max_date = Column(Date, nullable=True)
+
+    # Bumped on every ingestion, used to key cached reports
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -6,6 +6,18 @@ from app.core.database import Base
 
 class FinancialData(Base):
     __tablename__ = "financial_data"
+    __table_args__ = (
+        Index("ix_financial_data_user_date", "user_id", "record_date"),
+        # record_date is part of the key so the index also works when the
+        # table is range-partitioned by record_date
+        Index(
+            "ux_financial_data_user_fingerprint",
+            "user_id",
+            "record_date",
+            "fingerprint",
+            unique=True,
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -25,4 +37,7 @@ class FinancialData(Base):
 
     source = Column(String, default="upload")  # upload | banking | gst
 
+    # Content hash of the row, used to skip re-uploaded records
+    fingerprint = Column(BigInteger, nullable=True)
+
     user = relationship("User", backref="financial_records")
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -6,6 +7,10 @@ from app.core.database import Base
 
 class Report(Base):
     __tablename__ = "reports"
+    __table_args__ = (
+        # Newest-first keyset pagination of a user's reports
+        Index("ix_reports_user_created", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -14,7 +19,12 @@ class Report(Base):
     # financial_health | creditworthiness | investor | compliance
 
     summary = Column(String, nullable=True)
-    metrics = Column(JSON, nullable=False)     # ratios, scores, KPIs
-    ai_insights = Column(JSON, nullable=True)  # recommendations
+    metrics = Column(JSONB, nullable=False)     # ratios, scores, KPIs
+    ai_insights = Column(JSONB, nullable=True)  # recommendations
+
+    # Set by retention compaction: daily | monthly, and how many reports
+    # of that period this row stands for
+    snapshot = Column(String, nullable=True)
+    snapshot_count = Column(Integer, nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
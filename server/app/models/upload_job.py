@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class UploadJob(Base):
+    __tablename__ = "upload_jobs"
+
+    id = Column(String, primary_key=True)  # uuid4
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    filename = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="queued")
+    # queued | running | completed | failed
+
+    rows_parsed = Column(Integer, default=0)
+    rows_inserted = Column(Integer, default=0)
+    rows_rejected = Column(Integer, default=0)
+    validation_errors = Column(JSON, nullable=True)  # first rejected rows
+    error = Column(String, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
@@ -1,39 +1,70 @@
+import json
+
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-import pandas as pd
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from typing import Optional
 
-from app.core.database import get_db
+from app.core.database import get_async_db, AsyncSessionLocal
 from app.core.security import get_current_user_id
 from app.ai.claude_client import claude_client
 from app.ai.prompts import SYSTEM_FINANCIAL_ANALYST, financial_health_prompt
 from app.ai.multilingual import apply_language
 from app.services.finance_analysis import FinanceAnalyzer
-from app.models.financial_data import FinancialData
+from app.services.metrics_store import MetricsStore
 from app.models.report import Report
 
 router = APIRouter()
 
 
+async def _save_report(
+    db: AsyncSession,
+    user_id: int,
+    metrics: dict,
+    ai_text: str,
+) -> Report:
+    report = Report(
+        user_id=user_id,
+        report_type="financial_health",
+        summary="Overall financial health analysis",
+        metrics=metrics,
+        ai_insights={
+        "summary": ai_text, 
+    },
+    )
+
+    db.add(report)
+    await db.commit()
+    await db.refresh(report)
+    return report
+
+
+async def _save_streamed_report(user_id: int, metrics: dict, ai_text: str) -> int:
+    # The request-scoped session may already be closed once streaming ends
+    async with AsyncSessionLocal() as db:
+        report = await _save_report(db, user_id, metrics, ai_text)
+        return report.id
+
+
 @router.post("/financial-health")
 async def ai_financial_health(
     language: str = "en",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    records = db.query(FinancialData).filter(
-        FinancialData.user_id == int(user_id)
-    ).all()
+    totals = await db.run_sync(
+        MetricsStore.load_totals, int(user_id), start_date, end_date
+    )
 
-    if not records:
+    if totals is None:
         return {
             "insights": "No financial data found. Please upload financial records first."
         }
 
-    df = pd.DataFrame(
-        [{k: v for k, v in r.__dict__.items() if not k.startswith("_")} for r in records]
-    )
-
-    metrics = FinanceAnalyzer.calculate_metrics(df)
+    metrics = FinanceAnalyzer.metrics_from_totals(totals)
 
     system_prompt = apply_language(SYSTEM_FINANCIAL_ANALYST, language)
     user_prompt = financial_health_prompt(
@@ -46,21 +77,56 @@ async def ai_financial_health(
 
     ai_text = response["content"]
     
-    report = Report(
-        user_id=int(user_id),
-        report_type="financial_health",
-        summary="Overall financial health analysis",
-        metrics=metrics,
-        ai_insights={
-        "summary": ai_text, 
-    },
-    )
-
-    db.add(report)
-    db.commit()
-    db.refresh(report)
+    report = await _save_report(db, int(user_id), metrics, ai_text)
 
     return {
         "report_id": report.id,
         "insights": response["content"],
     }
+
+
+
+@router.post("/financial-health/stream")
+async def ai_financial_health_stream(
+    language: str = "en",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Server-Sent Events variant: forwards tokens as they arrive, then
+    persists the assembled text and sends a final `done` event.
+    """
+    totals = await db.run_sync(
+        MetricsStore.load_totals, int(user_id), start_date, end_date
+    )
+
+    if totals is None:
+        return {
+            "insights": "No financial data found. Please upload financial records first."
+        }
+
+    metrics = FinanceAnalyzer.metrics_from_totals(totals)
+
+    system_prompt = apply_language(SYSTEM_FINANCIAL_ANALYST, language)
+    user_prompt = financial_health_prompt(
+        metrics,
+        industry="SME",
+        language=language,
+    )
+
+    async def events():
+        parts = []
+        async for token in claude_client.stream(system_prompt, user_prompt):
+            parts.append(token)
+            yield f"data: {json.dumps({'token': token})}\n\n"
+
+        report_id = await _save_streamed_report(int(user_id), metrics, "".join(parts))
+        yield f"event: done\ndata: {json.dumps({'report_id': report_id})}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
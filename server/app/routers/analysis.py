@@ -1,37 +1,52 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from datetime import date
 import pandas as pd
+from typing import Optional
 
 from app.core.database import get_db
 from app.core.security import get_current_user_id
 from app.services.finance_analysis import FinanceAnalyzer
+from app.services.metrics_store import MetricsStore
 from app.services.risk_engine import RiskEngine
 from app.services.benchmarking import BenchmarkingService
-from app.models.financial_data import FinancialData
+from app.services.peer_benchmarks import PeerBenchmarks
 from app.models.user import User
+from app.schemas.analysis import PortfolioScoringRequest
 from app.models.report import Report
+from app.services.report_cache import report_cache
 from app.services.working_capital import WorkingCapitalAdvisor
+from app.core.config import settings
 
 router = APIRouter()
 
 
 @router.get("/")
 def analyze(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    records = db.query(FinancialData).filter(
-        FinancialData.user_id == int(user_id)
-    ).all()
+    cache_key = report_cache.key(
+        int(user_id),
+        "analysis",
+        MetricsStore.data_version(db, int(user_id)),
+        start_date=start_date,
+        end_date=end_date,
+        benchmarks=BenchmarkingService.version(),
+        peers=PeerBenchmarks.version(db),
+    )
+    cached = report_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    if not records:
-        return {"detail": "No financial data available"}
+    totals = MetricsStore.load_totals(db, int(user_id), start_date, end_date)
 
-    df = pd.DataFrame(
-        [{k: v for k, v in r.__dict__.items() if not k.startswith("_")} for r in records]
-    )
+    if totals is None:
+        return {"detail": "No financial data available"}
 
-    metrics = FinanceAnalyzer.calculate_metrics(df)
+    metrics = FinanceAnalyzer.metrics_from_totals(totals)
     risk = RiskEngine.assess_risk(metrics)
     credit_score = RiskEngine.credit_score(metrics)
 
@@ -39,6 +54,12 @@ def analyze(
 
     user = db.query(User).get(int(user_id))
     benchmark = BenchmarkingService.compare(metrics, user.industry or "")
+    benchmark_percentiles = BenchmarkingService.percentile_ranks(metrics, user.industry or "")
+
+    # Peers are compared on all-time totals, so a date range has no peer ranks
+    peer_percentiles = {}
+    if start_date is None and end_date is None:
+        peer_percentiles = PeerBenchmarks.percentile_ranks(db, metrics, user.industry or "")
 
     report = Report(
         user_id=int(user_id),
@@ -49,6 +70,8 @@ def analyze(
             "risk": risk,
             "credit_score": credit_score,
             "benchmark": benchmark,
+            "benchmark_percentiles": benchmark_percentiles,
+            "peer_percentiles": peer_percentiles,
             "working_capital_suggestions": suggestions,
         },
     )
@@ -57,11 +80,58 @@ def analyze(
     db.commit()
     db.refresh(report)
 
-    return {
+    response = {
         "report_id": report.id,
         "metrics": metrics,
         "risk": risk,
         "credit_score": credit_score,
         "benchmark": benchmark,
+        "benchmark_percentiles": benchmark_percentiles,
+        "peer_percentiles": peer_percentiles,
         "working_capital_suggestions": suggestions,
     }
+    report_cache.set(cache_key, response)
+    return response
+
+
+@router.post("/benchmarks/reload")
+def reload_benchmarks(user_id: str = Depends(get_current_user_id)):
+    index = BenchmarkingService.reload()
+    return {
+        "version": index.version,
+        "industries": sorted(index.industries),
+    }
+
+
+@router.post("/batch")
+def score_portfolio(
+    payload: PortfolioScoringRequest,
+    user_id: str = Depends(get_current_user_id),
+):
+    """
+    Risk level, reasons, credit score and working capital suggestions for
+    many businesses at once, e.g. a lender's portfolio. Column-wise in,
+    column-wise out.
+    """
+    count = len(payload.profit_margin)
+    if count > settings.ANALYSIS_BATCH_MAX_ROWS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.ANALYSIS_BATCH_MAX_ROWS} rows per request",
+        )
+
+    frame = pd.DataFrame({
+        "profit_margin": payload.profit_margin,
+        "debt_to_revenue": payload.debt_to_revenue,
+        "working_capital": payload.working_capital,
+    })
+    risk = RiskEngine.assess_risk_batch(frame)
+
+    return {
+        "count": count,
+        "ids": payload.ids if payload.ids is not None else list(range(count)),
+        "risk_level": risk["risk_level"].tolist(),
+        "reasons": risk["reasons"].tolist(),
+        "credit_score": RiskEngine.credit_score_batch(frame).tolist(),
+        "working_capital_suggestions": WorkingCapitalAdvisor.suggest_batch(frame).tolist(),
+    }
@@ -1,36 +1,45 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-import pandas as pd
+from datetime import date
+from typing import Optional
 
 from app.core.database import get_db
 from app.core.security import get_current_user_id
-from app.models.financial_data import FinancialData
 from app.models.report import Report
+from app.services.report_cache import report_cache
 from app.services.finance_analysis import FinanceAnalyzer
+from app.services.metrics_store import MetricsStore
 from app.services.compliance_engine import ComplianceEngine
 
 router = APIRouter()
 
 @router.get("/")
 def compliance_status(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    records = db.query(FinancialData).filter(
-        FinancialData.user_id == int(user_id)
-    ).all()
+    cache_key = report_cache.key(
+        int(user_id),
+        "compliance",
+        MetricsStore.data_version(db, int(user_id)),
+        start_date=start_date,
+        end_date=end_date,
+    )
+    cached = report_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    if not records:
-        return {"detail": "No financial data available for compliance check"}
+    totals = MetricsStore.load_totals(db, int(user_id), start_date, end_date)
 
-    df = pd.DataFrame(
-        [{k: v for k, v in r.__dict__.items() if not k.startswith("_")} for r in records]
-    )
+    if totals is None:
+        return {"detail": "No financial data available for compliance check"}
 
-    metrics = FinanceAnalyzer.calculate_metrics(df)
+    metrics = FinanceAnalyzer.metrics_from_totals(totals)
 
     total_revenue = metrics.get("total_revenue", 0)
-    total_tax_paid = df.get("tax_paid", pd.Series(dtype=float)).sum()
+    total_tax_paid = totals["tax_paid"]
 
     compliance = ComplianceEngine.assess_tax_compliance(
         revenue=total_revenue,
@@ -52,9 +61,11 @@ def compliance_status(
     db.commit()
     db.refresh(report)
 
-    return {
+    response = {
         "report_id": report.id,
         "gst_filing_status": compliance["status"],
         "compliance_risk": compliance["risk"],
         "notes": compliance["note"],
     }
+    report_cache.set(cache_key, response)
+    return response
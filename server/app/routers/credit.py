@@ -1,31 +1,28 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
+from datetime import date
+from typing import Optional
 
 from app.core.database import get_db
 from app.core.security import get_current_user_id
-from app.models.financial_data import FinancialData
 from app.services.finance_analysis import FinanceAnalyzer
-import pandas as pd
+from app.services.metrics_store import MetricsStore
 
 router = APIRouter()
 
 @router.get("/")
 def credit_risk(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
-    records = db.query(FinancialData).filter(
-        FinancialData.user_id == int(user_id)
-    ).all()
+    totals = MetricsStore.load_totals(db, int(user_id), start_date, end_date)
 
-    if not records:
+    if totals is None:
         return {"detail": "No financial data available"}
 
-    df = pd.DataFrame(
-        [{k: v for k, v in r.__dict__.items() if not k.startswith("_")} for r in records]
-    )
-
-    metrics = FinanceAnalyzer.calculate_metrics(df)
+    metrics = FinanceAnalyzer.metrics_from_totals(totals)
 
     risk = "Low"
     if metrics["debt_to_revenue"] > 0.6:
@@ -0,0 +1,56 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.security import get_current_user_id
+from app.services.data_access import DEFAULT_COLUMNS, FinancialDataLoader
+from app.services.export import EXPORT_FORMATS, FinancialDataExporter
+
+router = APIRouter()
+
+
+def _export_frames(
+    user_id: int,
+    start_date: Optional[date],
+    end_date: Optional[date],
+):
+    # The response outlives the request's dependencies, so the stream
+    # owns its own session for the server-side cursor.
+    with SessionLocal() as db:
+        yield from FinancialDataLoader.iter_frames(
+            db,
+            user_id,
+            columns=DEFAULT_COLUMNS,
+            chunk_rows=settings.EXPORT_BATCH_ROWS,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+
+@router.get("/export")
+def export_financial_data(
+    format: str = "parquet",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    user_id: str = Depends(get_current_user_id),
+):
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"format must be one of: {', '.join(EXPORT_FORMATS)}",
+        )
+
+    media_type, extension = EXPORT_FORMATS[format]
+    frames = _export_frames(int(user_id), start_date, end_date)
+
+    return StreamingResponse(
+        FinancialDataExporter.stream(frames, format),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="financial_data.{extension}"'
+        },
+    )
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-import pandas as pd
 
 from app.core.database import get_db
 from app.core.security import get_current_user_id
-from app.models.financial_data import FinancialData
+from app.services.data_access import FinancialDataLoader
+from app.services.metrics_store import MetricsStore
 from app.models.report import Report
+from app.services.report_cache import report_cache
 from app.services.forecasting import ForecastingService
 
 router = APIRouter()
@@ -15,31 +16,44 @@ def forecast(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    records = db.query(FinancialData).filter(
-        FinancialData.user_id == int(user_id)
-    ).order_by(FinancialData.record_date).all()
+    cache_key = report_cache.key(
+        int(user_id),
+        "forecast",
+        MetricsStore.data_version(db, int(user_id)),
+    )
+    cached = report_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    df = FinancialDataLoader.load_frame(
+        db,
+        int(user_id),
+        columns=["record_date", "revenue", "expenses"],
+        order_by_date=True,
+    )
 
-    if len(records) < 3:
-        return {"detail": "Not enough data for forecasting"}
+    details = ForecastingService.forecast(df)
 
-    df = pd.DataFrame(
-        [{k: v for k, v in r.__dict__.items() if not k.startswith("_")} for r in records]
-    )
+    if details is None:
+        return {"detail": "Not enough data for forecasting"}
 
-    forecast = ForecastingService.forecast_revenue(df)
+    forecast = ForecastingService.revenue_by_month(details)
 
     report = Report(
         user_id=int(user_id),
         report_type="forecast",
         summary="Revenue forecast based on historical trends",
-        metrics=forecast,
+        metrics={**forecast, "details": details},
     )
 
     db.add(report)
     db.commit()
     db.refresh(report)
 
-    return {
+    response = {
         "forecast": forecast,
+        "details": details,
         "report_id": report.id,
     }
+    report_cache.set(cache_key, response)
+    return response
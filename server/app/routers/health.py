@@ -1,5 +1,9 @@
 from fastapi import APIRouter
 
+from app.services.report_cache import report_cache
+from app.ai.response_cache import ai_response_cache
+from app.ai.claude_client import claude_client
+
 router = APIRouter()
 
 @router.get("/")
@@ -8,3 +12,16 @@ def health():
         "status": "ok",
         "service": "SME Financial Health Platform"
     }
+
+
+@router.get("/cache")
+def cache_stats():
+    return {
+        "reports": report_cache.stats(),
+        "ai_responses": ai_response_cache.stats(),
+    }
+
+
+@router.get("/ai")
+def ai_client_stats():
+    return claude_client.metrics.snapshot()
@@ -0,0 +1,66 @@
+import pandas as pd
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Query
+
+from app.core.config import settings
+from app.core.security import get_current_user_id
+from app.services.file_parser import FileParser, FileTooLargeError
+from app.services.reconciliation import ReconciliationEngine
+
+router = APIRouter()
+
+
+def _read_frame(file: UploadFile) -> pd.DataFrame:
+    chunks = FileParser.iter_chunks(
+        file.file,
+        file.filename,
+        chunk_rows=settings.UPLOAD_CHUNK_ROWS,
+        max_bytes=settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024,
+    )
+    try:
+        df = pd.concat(list(chunks), ignore_index=True)
+    except FileTooLargeError:
+        raise HTTPException(status_code=413, detail="File too large")
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid file format")
+
+    df = FileParser.normalize_columns(df)
+    missing = {"record_date", "amount"} - set(df.columns)
+    if missing:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{file.filename}: missing columns {', '.join(sorted(missing))}",
+        )
+    return df
+
+
+@router.post("/")
+def reconcile(
+    bank_file: UploadFile = File(...),
+    books_file: UploadFile = File(...),
+    date_window_days: int = Query(0, ge=0, le=31),
+    amount_tolerance: float = Query(0.0, ge=0, le=1000),
+    max_rows: int = Query(1000, ge=0, le=100000),
+    user_id: str = Depends(get_current_user_id),
+):
+    bank_df = _read_frame(bank_file)
+    books_df = _read_frame(books_file)
+
+    try:
+        pairs, unmatched_bank, unmatched_books = ReconciliationEngine.match(
+            bank_df,
+            books_df,
+            date_window_days=date_window_days,
+            amount_tolerance=amount_tolerance,
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=400,
+            detail="record_date and amount must contain valid dates and numbers",
+        )
+
+    return {
+        **ReconciliationEngine.summary(bank_df, books_df, pairs),
+        "matched_pairs": pairs.head(max_rows).to_dict(orient="records"),
+        "unmatched_bank_rows": unmatched_bank[:max_rows].tolist(),
+        "unmatched_book_rows": unmatched_books[:max_rows].tolist(),
+    }
@@ -1,23 +1,121 @@
-from fastapi import APIRouter, Depends
+import base64
+import hashlib
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple, Union
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.security import get_current_user_id
 from app.models.report import Report
-from app.schemas.report import ReportResponse
-from typing import List
+from app.schemas.report import ReportResponse, ReportSummaryResponse
 
 router = APIRouter()
 
+SUMMARY_COLUMNS = [
+    Report.id,
+    Report.report_type,
+    Report.summary,
+    Report.created_at,
+    Report.snapshot,
+    Report.snapshot_count,
+]
+DETAIL_COLUMNS = SUMMARY_COLUMNS + [Report.metrics, Report.ai_insights]
+
+_reports_adapter = TypeAdapter(List[ReportResponse])
+_summaries_adapter = TypeAdapter(List[ReportSummaryResponse])
+_report_adapter = TypeAdapter(ReportResponse)
+
+
+def _encode_cursor(created_at: datetime, report_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), report_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, report_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(report_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-@router.get("/", response_model=List[ReportResponse])
+
+def _etag_response(body: bytes, if_none_match: Optional[str], headers: dict = None) -> Response:
+    """
+    JSON response with a content-hash ETag, or 304 when the client
+    already has this exact body.
+    """
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    headers = {**(headers or {}), "ETag": etag, "Cache-Control": "private, no-cache"}
+
+    # Proxies may weaken the tag (W/"..."), which still matches here
+    tags = [tag.strip().removeprefix("W/") for tag in (if_none_match or "").split(",")]
+    if etag in tags or "*" in tags:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/", response_model=Union[List[ReportResponse], List[ReportSummaryResponse]])
 def list_reports(
+    limit: int = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    report_type: Optional[str] = None,
+    include_details: bool = True,
+    if_none_match: Optional[str] = Header(None),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    return (
-        db.query(Report)
-        .filter(Report.user_id == int(user_id))
-        .order_by(Report.created_at.desc())
-        .all()
-    )
\ No newline at end of file
+    """
+    Newest reports first, one page at a time. The next page's cursor is
+    returned in the X-Next-Cursor header. include_details=false returns
+    ReportSummaryResponse items, without metrics and ai_insights.
+    """
+    limit = min(limit or settings.REPORTS_PAGE_SIZE, settings.REPORTS_MAX_PAGE_SIZE)
+
+    columns = DETAIL_COLUMNS if include_details else SUMMARY_COLUMNS
+    stmt = select(*columns).where(Report.user_id == int(user_id))
+    if report_type:
+        stmt = stmt.where(Report.report_type == report_type)
+    if cursor:
+        created_at, report_id = _decode_cursor(cursor)
+        stmt = stmt.where(tuple_(Report.created_at, Report.id) < tuple_(created_at, report_id))
+
+    # One extra row tells whether there is a next page
+    stmt = stmt.order_by(Report.created_at.desc(), Report.id.desc()).limit(limit + 1)
+    rows = [row._mapping for row in db.execute(stmt)]
+
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = _encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+    adapter = _reports_adapter if include_details else _summaries_adapter
+    body = adapter.dump_json(adapter.validate_python([dict(row) for row in rows]))
+    return _etag_response(body, if_none_match, headers)
+
+
+@router.get("/{report_id}", response_model=ReportResponse)
+def get_report(
+    report_id: int,
+    if_none_match: Optional[str] = Header(None),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    row = db.execute(
+        select(*DETAIL_COLUMNS).where(
+            Report.id == report_id,
+            Report.user_id == int(user_id),
+        )
+    ).first()
+
+    if row is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+
+    body = _report_adapter.dump_json(_report_adapter.validate_python(dict(row._mapping)))
+    return _etag_response(body, if_none_match)
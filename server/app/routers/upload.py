@@ -1,57 +1,88 @@
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, get_async_db
 from app.core.security import get_current_user_id
-from app.services.file_parser import FileParser
-from app.models.financial_data import FinancialData
+from app.services.file_parser import FileParser, FileTooLargeError
+from app.services.ingestion import IngestionService, IngestionError
+from app.services.upload_jobs import UploadJobQueue
+from app.models.upload_job import UploadJob
+from app.schemas.upload import UploadJobResponse
 
 router = APIRouter()
 
 
 @router.post("/")
-async def upload_file(
+def upload_file(
     file: UploadFile = File(...),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    contents = await file.read()
+    max_bytes = settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=413, detail="File too large")
 
-    try:
-        df = FileParser.parse_file(contents, file.filename)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid file format")
-
-    # Normalize columns
-    df.columns = (
-        df.columns
-          .astype(str)
-          .str.strip()
-          .str.lower()
-          .str.replace(" ", "_")
+    chunks = FileParser.iter_chunks(
+        file.file,
+        file.filename,
+        chunk_rows=settings.UPLOAD_CHUNK_ROWS,
+        max_bytes=max_bytes,
     )
 
-    if "record_date" not in df.columns:
+    try:
+        stats = IngestionService.ingest_chunks(db, chunks, user_id=int(user_id))
+        db.commit()
+    except FileTooLargeError:
+        db.rollback()
+        raise HTTPException(status_code=413, detail="File too large")
+    except IngestionError as exc:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(exc))
+    except SQLAlchemyError:
+        db.rollback()
         raise HTTPException(
             status_code=400,
-            detail="record_date column is required"
+            detail="Could not store uploaded records"
         )
+    except Exception:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid file format")
+
+    return {"status": "Upload successful", **stats}
+
 
-    for _, row in df.iterrows():
-        record = FinancialData(
-            user_id=int(user_id),
-            record_date=row.get("record_date"),
-            revenue=row.get("revenue", 0),
-            expenses=row.get("expenses", 0),
-            profit=row.get("profit", 0),
-            accounts_receivable=row.get("accounts_receivable", 0),
-            accounts_payable=row.get("accounts_payable", 0),
-            inventory_value=row.get("inventory_value"),
-            loan_obligations=row.get("loan_obligations", 0),
-            tax_paid=row.get("tax_paid", 0),
-            source="upload",
+@router.post("/jobs", status_code=202)
+def submit_upload_job(
+    file: UploadFile = File(...),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    try:
+        job = UploadJobQueue.submit(db, file.file, file.filename, int(user_id))
+    except FileTooLargeError:
+        raise HTTPException(status_code=413, detail="File too large")
+
+    return {"job_id": job.id, "status": job.status}
+
+
+@router.get("/jobs/{job_id}", response_model=UploadJobResponse)
+async def upload_job_status(
+    job_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db),
+):
+    job = await db.scalar(
+        select(UploadJob).where(
+            UploadJob.id == job_id,
+            UploadJob.user_id == int(user_id),
         )
-        db.add(record)
+    )
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Upload job not found")
 
-    db.commit()
-    return {"status": "Upload successful"}
+    return job
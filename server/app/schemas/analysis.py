@@ -0,0 +1,25 @@
+from pydantic import BaseModel, model_validator
+from typing import List, Optional
+
+
+class PortfolioScoringRequest(BaseModel):
+    """
+    Column-wise metrics for many businesses, one list entry per business.
+    """
+    ids: Optional[List[str]] = None
+    profit_margin: List[float]
+    debt_to_revenue: List[float]
+    working_capital: List[float]
+
+    @model_validator(mode="after")
+    def check_lengths(self):
+        lengths = {
+            len(self.profit_margin),
+            len(self.debt_to_revenue),
+            len(self.working_capital),
+        }
+        if self.ids is not None:
+            lengths.add(len(self.ids))
+        if len(lengths) != 1:
+            raise ValueError("All columns must have the same length")
+        return self
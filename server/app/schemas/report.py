@@ -1,15 +1,20 @@
 from pydantic import BaseModel
-from typing import Dict, Any, Union
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
 
 
-class ReportResponse(BaseModel):
+class ReportSummaryResponse(BaseModel):
     id: int
     report_type: str
     summary: str | None
-    metrics: Dict[str, Any]
-    ai_insights: Union[Dict[str, Any], str, None] 
     created_at: datetime
+    snapshot: Optional[str] = None
+    snapshot_count: Optional[int] = None
 
     class Config:
         from_attributes = True
+
+
+class ReportResponse(ReportSummaryResponse):
+    metrics: Dict[str, Any]
+    ai_insights: Union[Dict[str, Any], str, None]
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+
+class UploadJobResponse(BaseModel):
+    id: str
+    filename: str
+    status: str
+    rows_parsed: int
+    rows_inserted: int
+    rows_rejected: Optional[int] = 0
+    validation_errors: Optional[List[Dict[str, Any]]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
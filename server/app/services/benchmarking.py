@@ -1,37 +1,203 @@
 import json
-from typing import Dict
+import os
+import threading
+import time
 from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional
 
+import numpy as np
+
+from app.core.config import settings
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
 
 BENCHMARK_FILE = Path(__file__).resolve().parent.parent / "data" / "industry_benchmarks.json"
 
 
+class MetricBenchmark(NamedTuple):
+    average: float
+    # Percentile levels (0-100) and the metric values at those levels,
+    # both sorted ascending. Empty when only an average is published.
+    levels: np.ndarray
+    values: np.ndarray
+
+    def percentile_rank(self, actual: float) -> Optional[float]:
+        """
+        Interpolated percentile of `actual` within the distribution,
+        clamped to the outermost published levels.
+        """
+        if not len(self.levels):
+            return None
+        return round(float(np.interp(actual, self.values, self.levels)), 1)
+
+
+class BenchmarkIndex:
+    """
+    Immutable industry -> metric -> MetricBenchmark lookup. A reload
+    builds a new index and swaps it in, readers never see a partial one.
+    """
+
+    def __init__(self, industries: Mapping[str, Mapping[str, MetricBenchmark]], version: int = 0):
+        self.industries = MappingProxyType({
+            name: MappingProxyType(dict(metrics)) for name, metrics in industries.items()
+        })
+        self.version = version
+
+    def get(self, industry: str) -> Optional[Mapping[str, MetricBenchmark]]:
+        return self.industries.get(industry.strip().lower())
+
+    @staticmethod
+    def _metric(industry: str, name: str, spec) -> MetricBenchmark:
+        """
+        Accepts either a scalar average (the original format) or
+        {"average": x, "percentiles": {"10": a, "50": b, "90": c}}.
+        """
+        empty = np.empty(0, dtype=np.float64)
+        if isinstance(spec, (int, float)):
+            return MetricBenchmark(float(spec), empty, empty)
+
+        if not isinstance(spec, dict):
+            raise ValueError(f"{industry}.{name}: expected a number or an object")
+
+        percentiles = spec.get("percentiles") or {}
+        levels = np.array([float(p) for p in percentiles], dtype=np.float64)
+        values = np.array(list(percentiles.values()), dtype=np.float64)
+        order = np.argsort(levels)
+        levels, values = levels[order], values[order]
+
+        if len(levels) and ((levels < 0) | (levels > 100)).any():
+            raise ValueError(f"{industry}.{name}: percentile levels must be between 0 and 100")
+        if len(values) > 1 and (np.diff(values) < 0).any():
+            raise ValueError(f"{industry}.{name}: percentile values must be non-decreasing")
+
+        average = spec.get("average")
+        if average is None:
+            if not len(levels):
+                raise ValueError(f"{industry}.{name}: needs an average or percentiles")
+            # Fall back to the median of the distribution
+            average = float(np.interp(50.0, levels, values))
+
+        return MetricBenchmark(float(average), levels, values)
+
+    @classmethod
+    def from_dict(cls, data: Dict, version: int = 0) -> "BenchmarkIndex":
+        industries = {}
+        for industry, metrics in data.items():
+            industries[industry.strip().lower()] = {
+                name: cls._metric(industry, name, spec)
+                for name, spec in metrics.items()
+            }
+        return cls(industries, version)
+
+
 class BenchmarkingService:
+    _index: BenchmarkIndex = BenchmarkIndex({})
+    _mtime: Optional[float] = None
+    _checked_at: float = 0.0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def path() -> Path:
+        return Path(settings.BENCHMARK_FILE) if settings.BENCHMARK_FILE else BENCHMARK_FILE
+
+    @classmethod
+    def reload(cls) -> BenchmarkIndex:
+        """
+        Parses the benchmark file and swaps in a new index. On error the
+        current index is kept and the error is logged.
+        """
+        path = cls.path()
+        with cls._lock:
+            try:
+                mtime = os.stat(path).st_mtime
+                with open(path, "r") as f:
+                    data = json.load(f)
+                index = BenchmarkIndex.from_dict(data, cls._index.version + 1)
+            except (OSError, ValueError) as exc:
+                logger.error("Could not load industry benchmarks from %s: %s", path, exc)
+                cls._checked_at = time.monotonic()
+                return cls._index
+
+            cls._index = index
+            cls._mtime = mtime
+            cls._checked_at = time.monotonic()
+
+        logger.info(
+            "Loaded industry benchmarks for %s industries (version %s)",
+            len(index.industries), index.version,
+        )
+        return index
+
+    @classmethod
+    def index(cls) -> BenchmarkIndex:
+        """
+        Current index. The file's mtime is checked at most once per
+        BENCHMARK_RELOAD_INTERVAL_SECONDS and reloaded when it changed.
+        """
+        now = time.monotonic()
+        if cls._mtime is None or now - cls._checked_at >= settings.BENCHMARK_RELOAD_INTERVAL_SECONDS:
+            cls._checked_at = now
+            try:
+                changed = os.stat(cls.path()).st_mtime != cls._mtime
+            except OSError as exc:
+                logger.error("Could not stat industry benchmarks file: %s", exc)
+                changed = False
+            if changed:
+                cls.reload()
+        return cls._index
+
+    @classmethod
+    def version(cls) -> int:
+        return cls.index().version
+
     @staticmethod
     def load_benchmarks() -> Dict:
-        try:
-            with open(BENCHMARK_FILE, "r") as f:
-                return json.load(f)
-        except Exception:
-            return {}
+        """
+        Average per industry and metric, in the original file format.
+        """
+        return {
+            industry: {name: bench.average for name, bench in metrics.items()}
+            for industry, metrics in BenchmarkingService.index().industries.items()
+        }
 
     @staticmethod
     def compare(metrics: Dict[str, float], industry: str) -> Dict[str, str]:
-        benchmarks = BenchmarkingService.load_benchmarks()
-        industry_data = benchmarks.get(industry.lower())
+        industry_data = BenchmarkingService.index().get(industry)
 
         if not industry_data:
             return {"benchmark": "Industry data not available"}
 
         comparison = {}
-        for key, benchmark_value in industry_data.items():
+        for key, bench in industry_data.items():
             actual = metrics.get(key)
             if actual is None:
                 continue
 
-            if actual >= benchmark_value:
+            if actual >= bench.average:
                 comparison[key] = "Above industry average"
             else:
                 comparison[key] = "Below industry average"
 
         return comparison
+
+    @staticmethod
+    def percentile_ranks(metrics: Dict[str, float], industry: str) -> Dict[str, float]:
+        """
+        Percentile rank of each metric within the published industry
+        distribution. Metrics without a distribution are omitted.
+        """
+        industry_data = BenchmarkingService.index().get(industry)
+        if not industry_data:
+            return {}
+
+        ranks = {}
+        for key, bench in industry_data.items():
+            actual = metrics.get(key)
+            if actual is None:
+                continue
+            rank = bench.percentile_rank(actual)
+            if rank is not None:
+                ranks[key] = rank
+        return ranks
@@ -1,5 +1,11 @@
+import json
+import re
+import numpy as np
 import pandas as pd
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.services.reconciliation import ReconciliationEngine
 
 EXPENSE_RULES = {
     "rent": ["rent", "lease"],
@@ -10,21 +16,78 @@ EXPENSE_RULES = {
     "office": ["stationery", "supplies"],
 }
 
+
+class ExpenseMatcher:
+    """
+    Keyword rules compiled once into one regex per category and applied
+    with vectorized string ops. Categories keep their rule order: the
+    first category with a matching keyword wins.
+    """
+
+    def __init__(self, rules: Dict[str, List[str]]):
+        self.categories = []
+        self.patterns = []
+        for category, keywords in rules.items():
+            keywords = sorted({k.lower() for k in keywords if k}, key=len, reverse=True)
+            if not keywords:
+                continue
+            self.categories.append(category)
+            self.patterns.append(re.compile("|".join(map(re.escape, keywords))))
+
+    def match(self, descriptions: pd.Series, default: str = "other") -> pd.Series:
+        # Ledgers repeat descriptions heavily, so only unique values are matched
+        codes, uniques = pd.factorize(descriptions.astype(str).str.lower())
+        uniques = pd.Series(uniques, dtype=object)
+
+        labels = np.full(len(uniques), default, dtype=object)
+        pending = np.ones(len(uniques), dtype=bool)
+
+        for category, pattern in zip(self.categories, self.patterns):
+            if not pending.any():
+                break
+            candidates = np.flatnonzero(pending)
+            hits = uniques.iloc[candidates].str.contains(pattern).to_numpy(dtype=bool)
+            labels[candidates[hits]] = category
+            pending[candidates[hits]] = False
+
+        return pd.Series(labels[codes], index=descriptions.index)
+
+
 class BookkeepingService:
+    _matcher: Optional[ExpenseMatcher] = None
+
+    @classmethod
+    def configure_rules(cls, rules: Dict[str, List[str]]) -> None:
+        cls._matcher = ExpenseMatcher(rules)
+
+    @classmethod
+    def load_rules(cls, path: str) -> None:
+        """
+        Loads user-defined rules ({"category": ["keyword", ...]}) from a
+        JSON file. They take precedence over, and replace same-named,
+        built-in EXPENSE_RULES categories.
+        """
+        with open(Path(path), "r") as f:
+            custom = json.load(f)
+
+        rules = dict(custom)
+        for category, keywords in EXPENSE_RULES.items():
+            rules.setdefault(category, keywords)
+        cls.configure_rules(rules)
+
+    @classmethod
+    def matcher(cls) -> ExpenseMatcher:
+        if cls._matcher is None:
+            cls.configure_rules(EXPENSE_RULES)
+        return cls._matcher
+
     @staticmethod
     def categorize_expenses(df: pd.DataFrame) -> pd.DataFrame:
         if "description" not in df.columns:
             df["expense_category"] = "uncategorized"
             return df
 
-        def classify(desc: str) -> str:
-            desc = str(desc).lower()
-            for category, keywords in EXPENSE_RULES.items():
-                if any(k in desc for k in keywords):
-                    return category
-            return "other"
-
-        df["expense_category"] = df["description"].apply(classify)
+        df["expense_category"] = BookkeepingService.matcher().match(df["description"])
         return df
 
     @staticmethod
@@ -38,17 +101,14 @@ class BookkeepingService:
     @staticmethod
     def reconcile_bank_books(
         bank_df: pd.DataFrame,
-        books_df: pd.DataFrame
+        books_df: pd.DataFrame,
+        date_window_days: int = 0,
+        amount_tolerance: float = 0.0,
     ) -> Dict[str, int]:
-        matched = bank_df.merge(
+        pairs, _, _ = ReconciliationEngine.match(
+            bank_df,
             books_df,
-            on=["record_date", "amount"],
-            how="inner"
+            date_window_days=date_window_days,
+            amount_tolerance=amount_tolerance,
         )
-        return {
-            "bank_transactions": len(bank_df),
-            "book_entries": len(books_df),
-            "matched": len(matched),
-            "unmatched_bank": len(bank_df) - len(matched),
-            "unmatched_books": len(books_df) - len(matched),
-        }
+        return ReconciliationEngine.summary(bank_df, books_df, pairs)
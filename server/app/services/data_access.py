@@ -0,0 +1,114 @@
+from datetime import date
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.models.financial_data import FinancialData
+
+
+# pandas dtypes for each financial_data column loaded into a frame
+COLUMN_DTYPES = {
+    "id": "int64",
+    "user_id": "int64",
+    "record_date": "datetime64[ns]",
+    "revenue": "float64",
+    "expenses": "float64",
+    "profit": "float64",
+    "accounts_receivable": "float64",
+    "accounts_payable": "float64",
+    "inventory_value": "float64",
+    "loan_obligations": "float64",
+    "tax_paid": "float64",
+    "source": "object",
+}
+
+DEFAULT_COLUMNS = [c for c in COLUMN_DTYPES if c != "user_id"]
+
+
+class FinancialDataLoader:
+    """
+    Loads financial_data as Core rows straight into a columnar DataFrame,
+    avoiding ORM hydration and the `r.__dict__` copy per row.
+    """
+
+    @staticmethod
+    def query(
+        user_id: int,
+        columns: Optional[Sequence[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        order_by_date: bool = False,
+    ) -> Select:
+        columns = list(columns or DEFAULT_COLUMNS)
+        stmt = select(*[getattr(FinancialData, c) for c in columns]).where(
+            FinancialData.user_id == user_id
+        )
+
+        if start_date:
+            stmt = stmt.where(FinancialData.record_date >= start_date)
+        if end_date:
+            stmt = stmt.where(FinancialData.record_date <= end_date)
+        if order_by_date:
+            stmt = stmt.order_by(FinancialData.record_date, FinancialData.id)
+        return stmt
+
+    @staticmethod
+    def to_frame(rows: List[tuple], columns: Sequence[str]) -> pd.DataFrame:
+        if not rows:
+            return pd.DataFrame(
+                {c: pd.Series(dtype=COLUMN_DTYPES[c]) for c in columns}
+            )
+
+        # Transpose row tuples into one array per column
+        data = {}
+        for col, values in zip(columns, zip(*rows)):
+            dtype = COLUMN_DTYPES[col]
+            if dtype == "float64":
+                data[col] = np.array(values, dtype=np.float64)  # None -> nan
+            elif dtype == "datetime64[ns]":
+                data[col] = pd.to_datetime(values)
+            else:
+                data[col] = np.array(values, dtype=dtype)
+        return pd.DataFrame(data, columns=list(columns))
+
+    @staticmethod
+    def load_frame(
+        db: Session,
+        user_id: int,
+        columns: Optional[Sequence[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        order_by_date: bool = False,
+    ) -> pd.DataFrame:
+        columns = list(columns or DEFAULT_COLUMNS)
+        stmt = FinancialDataLoader.query(
+            user_id, columns, start_date, end_date, order_by_date
+        )
+        rows = db.execute(stmt).all()
+        return FinancialDataLoader.to_frame(rows, columns)
+
+    @staticmethod
+    def iter_frames(
+        db: Session,
+        user_id: int,
+        columns: Optional[Sequence[str]] = None,
+        chunk_rows: int = 50000,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streams the user's rows in date order as frames of `chunk_rows`
+        using a server-side cursor.
+        """
+        columns = list(columns or DEFAULT_COLUMNS)
+        stmt = FinancialDataLoader.query(
+            user_id, columns, start_date, end_date, order_by_date=True
+        )
+        result = db.execute(
+            stmt.execution_options(stream_results=True, yield_per=chunk_rows)
+        )
+        for partition in result.partitions(chunk_rows):
+            yield FinancialDataLoader.to_frame(partition, columns)
@@ -0,0 +1,104 @@
+from io import RawIOBase
+from typing import Iterable, Iterator, List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.services.data_access import DEFAULT_COLUMNS
+
+ARROW_TYPES = {
+    "id": pa.int64(),
+    "record_date": pa.date32(),
+    "revenue": pa.float64(),
+    "expenses": pa.float64(),
+    "profit": pa.float64(),
+    "accounts_receivable": pa.float64(),
+    "accounts_payable": pa.float64(),
+    "inventory_value": pa.float64(),
+    "loan_obligations": pa.float64(),
+    "tax_paid": pa.float64(),
+    "source": pa.string(),
+}
+
+EXPORT_SCHEMA = pa.schema([(c, ARROW_TYPES[c]) for c in DEFAULT_COLUMNS])
+
+EXPORT_FORMATS = {
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrow"),
+    "csv": ("text/csv", "csv"),
+}
+
+
+class _ChunkSink(RawIOBase):
+    """
+    Write-only file object the Arrow writers write into; whatever has
+    been written so far is drained after each batch and streamed out.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class FinancialDataExporter:
+    """
+    Serializes a stream of financial_data frames (see
+    FinancialDataLoader.iter_frames) batch by batch, so an export never
+    holds more than one batch in memory.
+    """
+
+    @staticmethod
+    def to_table(frame: pd.DataFrame) -> pa.Table:
+        return pa.Table.from_pandas(frame, preserve_index=False).cast(EXPORT_SCHEMA)
+
+    @staticmethod
+    def iter_parquet(frames: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+        sink = _ChunkSink()
+        # One row group per batch; the footer is written on close
+        with pq.ParquetWriter(sink, EXPORT_SCHEMA, compression="zstd") as writer:
+            for frame in frames:
+                writer.write_table(FinancialDataExporter.to_table(frame))
+                yield sink.drain()
+        yield sink.drain()
+
+    @staticmethod
+    def iter_arrow(frames: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+        sink = _ChunkSink()
+        with pa.ipc.new_stream(sink, EXPORT_SCHEMA) as writer:
+            for frame in frames:
+                writer.write_table(FinancialDataExporter.to_table(frame))
+                yield sink.drain()
+        yield sink.drain()
+
+    @staticmethod
+    def iter_csv(frames: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+        header = True
+        for frame in frames:
+            frame = frame.assign(record_date=frame["record_date"].dt.strftime("%Y-%m-%d"))
+            yield frame.to_csv(index=False, header=header).encode()
+            header = False
+        if header:
+            yield (",".join(DEFAULT_COLUMNS) + "\n").encode()
+
+    @staticmethod
+    def stream(frames: Iterable[pd.DataFrame], fmt: str) -> Iterator[bytes]:
+        writers = {
+            "parquet": FinancialDataExporter.iter_parquet,
+            "arrow": FinancialDataExporter.iter_arrow,
+            "csv": FinancialDataExporter.iter_csv,
+        }
+        for chunk in writers[fmt](frames):
+            if chunk:
+                yield chunk
@@ -1,7 +1,53 @@
 import pandas as pd
-from typing import Union
-from io import BytesIO
-from PyPDF2 import PdfReader
+from typing import BinaryIO, Iterator, List, Optional, Union
+from io import BufferedReader, BytesIO, RawIOBase
+
+from app.services.pdf_extractor import PdfStatementExtractor
+from app.services.validation import COLUMN_ALIASES
+
+# Columnar formats are projected to the columns ingestion understands
+FINANCIAL_COLUMNS = {
+    "record_date",
+    "revenue",
+    "expenses",
+    "profit",
+    "accounts_receivable",
+    "accounts_payable",
+    "inventory_value",
+    "loan_obligations",
+    "tax_paid",
+}
+
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+ARROW_EXTENSIONS = (".arrow", ".feather", ".ipc")
+
+
+class FileTooLargeError(ValueError):
+    pass
+
+
+class _LimitedReader(RawIOBase):
+    """
+    Wraps a binary file object and fails as soon as more than
+    `max_bytes` have been read, so oversized uploads are rejected
+    while streaming instead of after being fully loaded.
+    """
+
+    def __init__(self, fileobj: BinaryIO, max_bytes: Optional[int]):
+        self._file = fileobj
+        self._max_bytes = max_bytes
+        self._read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._file.read(len(buffer))
+        self._read += len(data)
+        if self._max_bytes is not None and self._read > self._max_bytes:
+            raise FileTooLargeError("File exceeds maximum upload size")
+        buffer[:len(data)] = data
+        return len(data)
 
 
 class FileParser:
@@ -16,20 +62,24 @@ class FileParser:
     @staticmethod
     def parse_pdf(file_bytes: bytes) -> pd.DataFrame:
         """
-        Assumes PDF is a text-based financial export.
-        MVP: Extracts tables-like text → structured later
+        Assumes PDF is a text-based statement or financial export with a
+        transaction table, see PdfStatementExtractor.
         """
-        reader = PdfReader(BytesIO(file_bytes))
-        text = "\n".join(page.extract_text() or "" for page in reader.pages)
+        return PdfStatementExtractor.extract(file_bytes)
 
-        # Very basic parser (MVP)
-        rows = []
-        for line in text.splitlines():
-            parts = line.split()
-            if len(parts) >= 2:
-                rows.append(parts)
+    @staticmethod
+    def parse_parquet(file_bytes: bytes) -> pd.DataFrame:
+        return pd.concat(
+            FileParser.iter_parquet(BytesIO(file_bytes), chunk_rows=1 << 20),
+            ignore_index=True,
+        )
 
-        return pd.DataFrame(rows)
+    @staticmethod
+    def parse_arrow(file_bytes: bytes) -> pd.DataFrame:
+        return pd.concat(
+            FileParser.iter_arrow(BytesIO(file_bytes)),
+            ignore_index=True,
+        )
 
     @staticmethod
     def parse_file(
@@ -42,5 +92,163 @@ class FileParser:
             return FileParser.parse_xlsx(file_bytes)
         elif filename.endswith(".pdf"):
             return FileParser.parse_pdf(file_bytes)
+        elif filename.endswith(PARQUET_EXTENSIONS):
+            return FileParser.parse_parquet(file_bytes)
+        elif filename.endswith(ARROW_EXTENSIONS):
+            return FileParser.parse_arrow(file_bytes)
+        else:
+            raise ValueError("Unsupported file format")
+
+    @staticmethod
+    def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+        df.columns = (
+            df.columns
+              .astype(str)
+              .str.strip()
+              .str.lower()
+              .str.replace(" ", "_")
+        )
+        return df
+
+    @staticmethod
+    def _ensure_size(fileobj: BinaryIO, max_bytes: Optional[int]) -> None:
+        if max_bytes is None:
+            return
+        fileobj.seek(0, 2)
+        size = fileobj.tell()
+        fileobj.seek(0)
+        if size > max_bytes:
+            raise FileTooLargeError("File exceeds maximum upload size")
+
+    @staticmethod
+    def iter_csv(
+        fileobj: BinaryIO,
+        chunk_rows: int,
+        max_bytes: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        stream = BufferedReader(_LimitedReader(fileobj, max_bytes))
+        with pd.read_csv(stream, chunksize=chunk_rows) as reader:
+            for chunk in reader:
+                yield chunk
+
+    @staticmethod
+    def iter_xlsx(
+        fileobj: BinaryIO,
+        chunk_rows: int,
+        max_bytes: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        from openpyxl import load_workbook
+
+        # XLSX is a zip archive, the central directory must be readable,
+        # so the size is checked up-front instead of while reading.
+        FileParser._ensure_size(fileobj, max_bytes)
+
+        workbook = load_workbook(fileobj, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+
+            buffer = []
+            for row in rows:
+                buffer.append(row)
+                if len(buffer) >= chunk_rows:
+                    yield pd.DataFrame(buffer, columns=header)
+                    buffer = []
+
+            if buffer:
+                yield pd.DataFrame(buffer, columns=header)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def projection(names: List[str]) -> Optional[List[str]]:
+        """
+        Source columns that normalize to a FinancialData field, or None
+        (read everything) if none do, so validation can report it.
+        """
+        normalized = (
+            pd.Index(names).astype(str).str.strip().str.lower().str.replace(" ", "_")
+        )
+        selected = [
+            name for name, norm in zip(names, normalized)
+            if norm in FINANCIAL_COLUMNS or norm in COLUMN_ALIASES
+        ]
+        return selected or None
+
+    @staticmethod
+    def iter_parquet(
+        fileobj: BinaryIO,
+        chunk_rows: int,
+        max_bytes: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        import pyarrow.parquet as pq
+
+        # The footer holds the schema, so the file must be seekable and
+        # its size is checked up-front.
+        FileParser._ensure_size(fileobj, max_bytes)
+
+        parquet = pq.ParquetFile(fileobj)
+        columns = FileParser.projection(parquet.schema_arrow.names)
+        for batch in parquet.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas(date_as_object=False)
+
+    @staticmethod
+    def iter_arrow(
+        fileobj: BinaryIO,
+        max_bytes: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Arrow IPC in either the file (random access) or streaming format,
+        one frame per record batch.
+        """
+        import pyarrow as pa
+
+        FileParser._ensure_size(fileobj, max_bytes)
+
+        try:
+            reader = pa.ipc.open_file(fileobj)
+            batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+            schema = reader.schema
+        except pa.ArrowInvalid:
+            fileobj.seek(0)
+            reader = pa.ipc.open_stream(fileobj)
+            batches = iter(reader)
+            schema = reader.schema
+
+        columns = FileParser.projection(schema.names)
+        for batch in batches:
+            if columns is not None:
+                batch = batch.select(columns)
+            yield batch.to_pandas(date_as_object=False)
+
+    @staticmethod
+    def iter_chunks(
+        fileobj: Union[BinaryIO, bytes],
+        filename: str,
+        chunk_rows: int,
+        max_bytes: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yields the upload as DataFrames of at most `chunk_rows` rows,
+        reading from the file object instead of a full in-memory copy.
+        """
+        if isinstance(fileobj, bytes):
+            fileobj = BytesIO(fileobj)
+
+        if filename.endswith(".csv"):
+            yield from FileParser.iter_csv(fileobj, chunk_rows, max_bytes)
+        elif filename.endswith(".xlsx"):
+            yield from FileParser.iter_xlsx(fileobj, chunk_rows, max_bytes)
+        elif filename.endswith(".pdf"):
+            FileParser._ensure_size(fileobj, max_bytes)
+            df = FileParser.parse_pdf(fileobj.read())
+            for start in range(0, len(df), chunk_rows):
+                yield df.iloc[start:start + chunk_rows]
+        elif filename.endswith(PARQUET_EXTENSIONS):
+            yield from FileParser.iter_parquet(fileobj, chunk_rows, max_bytes)
+        elif filename.endswith(ARROW_EXTENSIONS):
+            yield from FileParser.iter_arrow(fileobj, max_bytes)
         else:
             raise ValueError("Unsupported file format")
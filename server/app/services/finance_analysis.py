@@ -1,9 +1,117 @@
 import pandas as pd
-from typing import Dict
+from datetime import date
+from typing import Dict, Optional
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+from app.models.financial_data import FinancialData
 from app.utils.helpers import safe_divide
 
 
+# Columns summed into the per-user totals behind every metric
+TOTAL_COLUMNS = [
+    "revenue",
+    "expenses",
+    "accounts_receivable",
+    "accounts_payable",
+    "inventory_value",
+    "loan_obligations",
+    "tax_paid",
+]
+
+
 class FinanceAnalyzer:
+    @staticmethod
+    def totals_from_frame(df: pd.DataFrame) -> Dict[str, float]:
+        return {
+            col: float(
+                pd.to_numeric(df.get(col, pd.Series(dtype=float)), errors="coerce").sum()
+            )
+            for col in TOTAL_COLUMNS
+        }
+
+    @staticmethod
+    def metrics_from_totals(totals: Dict[str, float]) -> Dict[str, float]:
+        """
+        Computes metrics from pre-summed totals in O(1), e.g. from the
+        user_financial_aggregates table.
+        """
+        revenue = totals.get("revenue", 0.0)
+        expenses = totals.get("expenses", 0.0)
+        profit = revenue - expenses
+
+        ar = totals.get("accounts_receivable", 0.0)
+        ap = totals.get("accounts_payable", 0.0)
+        inventory = totals.get("inventory_value", 0.0)
+        loans = totals.get("loan_obligations", 0.0)
+
+        return {
+            "total_revenue": round(revenue, 2),
+            "total_expenses": round(expenses, 2),
+            "profit": round(profit, 2),
+            "profit_margin": safe_divide(profit, revenue),
+            "working_capital": round(ar + inventory - ap, 2),
+            "debt_to_revenue": safe_divide(loans, revenue),
+        }
+
+    @staticmethod
+    def totals_query(
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Select:
+        """
+        Single SELECT SUM(...) ... GROUP BY user_id over financial_data,
+        optionally restricted to a record_date range (inclusive).
+        """
+        stmt = select(
+            FinancialData.user_id,
+            *[
+                func.coalesce(func.sum(getattr(FinancialData, col)), 0.0).label(col)
+                for col in TOTAL_COLUMNS
+            ],
+            func.count(FinancialData.id).label("row_count"),
+            func.min(FinancialData.record_date).label("min_date"),
+            func.max(FinancialData.record_date).label("max_date"),
+        ).group_by(FinancialData.user_id)
+
+        if start_date:
+            stmt = stmt.where(FinancialData.record_date >= start_date)
+        if end_date:
+            stmt = stmt.where(FinancialData.record_date <= end_date)
+        return stmt
+
+    @staticmethod
+    def sql_totals(
+        db: Session,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Optional[Dict]:
+        """
+        Pushes the sums down to the database so one row is returned
+        instead of hydrating every FinancialData object.
+        """
+        stmt = FinanceAnalyzer.totals_query(start_date, end_date).where(
+            FinancialData.user_id == user_id
+        )
+        row = db.execute(stmt).first()
+        if row is None:
+            return None
+
+        totals = dict(row._mapping)
+        totals.pop("user_id")
+        return totals
+
+    @staticmethod
+    def calculate_metrics_sql(
+        db: Session,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[str, float]:
+        totals = FinanceAnalyzer.sql_totals(db, user_id, start_date, end_date)
+        return FinanceAnalyzer.metrics_from_totals(totals or {})
+
     @staticmethod
     def calculate_metrics(df: pd.DataFrame) -> Dict[str, float]:
 
@@ -26,20 +134,5 @@ class FinanceAnalyzer:
               .str.lower()
         )
 
-        revenue = df.get("revenue", pd.Series(dtype=float)).sum()
-        expenses = df.get("expenses", pd.Series(dtype=float)).sum()
-        profit = revenue - expenses
-
-        ar = df.get("accounts_receivable", pd.Series(dtype=float)).sum()
-        ap = df.get("accounts_payable", pd.Series(dtype=float)).sum()
-        inventory = df.get("inventory_value", pd.Series(dtype=float)).sum()
-        loans = df.get("loan_obligations", pd.Series(dtype=float)).sum()
-
-        return {
-            "total_revenue": round(revenue, 2),
-            "total_expenses": round(expenses, 2),
-            "profit": round(profit, 2),
-            "profit_margin": safe_divide(profit, revenue),
-            "working_capital": round(ar + inventory - ap, 2),
-            "debt_to_revenue": safe_divide(loans, revenue),
-        }
+        totals = FinanceAnalyzer.totals_from_frame(df)
+        return FinanceAnalyzer.metrics_from_totals(totals)
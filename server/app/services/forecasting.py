@@ -1,32 +1,222 @@
+import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+
+
+SEASON_LENGTH = 12  # monthly buckets
+
+# Parameter grid searched jointly (vectorized) for exponential smoothing
+ALPHAS = np.array([0.1, 0.3, 0.5, 0.7, 0.9])
+BETAS = np.array([0.01, 0.1, 0.3])
+GAMMAS = np.array([0.05, 0.2, 0.5])
+
+Z_95 = 1.96
+
+MODEL_NAMES = ("linear_trend", "holt_winters", "seasonal_naive")
 
 
 class ForecastingService:
+    @staticmethod
+    def monthly_series(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Sums revenue and expenses into calendar-month buckets and derives
+        cash_flow = revenue - expenses.
+
+        The first and last month are dropped when the data does not cover
+        them fully (judged by the usual spacing between record dates), so
+        a few days of a month are not read as a collapse in revenue.
+        Months without any rows are interpolated from their neighbours
+        rather than counted as zero; `interpolated` flags them.
+        """
+        frame = pd.DataFrame({
+            "record_date": pd.to_datetime(df["record_date"]),
+            "revenue": pd.to_numeric(df.get("revenue", 0.0), errors="coerce"),
+            "expenses": pd.to_numeric(df.get("expenses", 0.0), errors="coerce"),
+        }).fillna({"revenue": 0.0, "expenses": 0.0})
+        frame = frame.dropna(subset=["record_date"])
+
+        grouped = frame.resample("MS", on="record_date")
+        monthly = grouped[["revenue", "expenses"]].sum()
+        rows = grouped.size()
+
+        dates = pd.Series(frame["record_date"].unique()).sort_values()
+        if len(dates) > 1 and len(monthly) > 0:
+            spacing = dates.diff().median()
+            first, last = dates.iloc[0], dates.iloc[-1]
+            # Complete if the previous / next record would have fallen
+            # outside the month
+            if first - spacing >= monthly.index[0]:
+                monthly, rows = monthly.iloc[1:], rows.iloc[1:]
+            month_end = monthly.index[-1] + pd.offsets.MonthEnd(0) if len(monthly) else None
+            if month_end is not None and last + spacing <= month_end:
+                monthly, rows = monthly.iloc[:-1], rows.iloc[:-1]
+
+        empty = (rows == 0).to_numpy()
+        # Edge months always hold a record, so this never extrapolates
+        monthly.loc[empty] = np.nan
+        monthly = monthly.interpolate(method="linear")
+        monthly["cash_flow"] = monthly["revenue"] - monthly["expenses"]
+        monthly["interpolated"] = empty
+        return monthly
+
+    @staticmethod
+    def _linear_trend(y: np.ndarray, horizon: int) -> np.ndarray:
+        t = np.arange(len(y))
+        slope, intercept = np.polyfit(t, y, 1)
+        future = np.arange(len(y), len(y) + horizon)
+        return intercept + slope * future
+
+    @staticmethod
+    def _seasonal_naive(y: np.ndarray, horizon: int) -> np.ndarray:
+        season = SEASON_LENGTH if len(y) >= SEASON_LENGTH else 1
+        last_season = y[-season:]
+        return np.resize(last_season, horizon)
+
+    @staticmethod
+    def _holt_winters(y: np.ndarray, horizon: int) -> np.ndarray:
+        """
+        Additive Holt-Winters (Holt's linear trend when there are fewer
+        than two seasons), with all grid parameter combinations fitted
+        at once as arrays and the lowest one-step SSE kept.
+        """
+        n = len(y)
+        seasonal = n >= 2 * SEASON_LENGTH
+        m = SEASON_LENGTH if seasonal else 1
+        gammas = GAMMAS if seasonal else np.array([0.0])
+
+        a, b, g = (p.ravel() for p in np.meshgrid(ALPHAS, BETAS, gammas, indexing="ij"))
+        grid = len(a)
+
+        if seasonal:
+            level0 = y[:m].mean()
+            trend0 = (y[m:2 * m].mean() - level0) / m
+            season0 = y[:m] - level0
+        else:
+            level0 = y[0]
+            trend0 = y[1] - y[0] if n > 1 else 0.0
+            season0 = np.zeros(1)
+
+        level = np.full(grid, level0, dtype=float)
+        trend = np.full(grid, trend0, dtype=float)
+        season = np.tile(season0, (grid, 1)).astype(float)
+        sse = np.zeros(grid)
+
+        for t in range(n):
+            idx = t % m
+            prediction = level + trend + season[:, idx]
+            sse += (y[t] - prediction) ** 2
+
+            new_level = a * (y[t] - season[:, idx]) + (1 - a) * (level + trend)
+            trend = b * (new_level - level) + (1 - b) * trend
+            season[:, idx] = g * (y[t] - new_level) + (1 - g) * season[:, idx]
+            level = new_level
+
+        best = int(np.argmin(sse))
+        steps = np.arange(1, horizon + 1)
+        future_season = season[best, (n + steps - 1) % m]
+        return level[best] + steps * trend[best] + future_season
+
+    @staticmethod
+    def _predict(name: str, y: np.ndarray, horizon: int) -> np.ndarray:
+        return getattr(ForecastingService, f"_{name}")(y, horizon)
+
+    @staticmethod
+    def _select_model(y: np.ndarray, horizon: int) -> Tuple[str, float]:
+        """
+        Backtests every model on the most recent months and returns the
+        one with the lowest MAE, with its holdout RMSE for intervals.
+        """
+        holdout = min(horizon, max(1, len(y) // 4))
+        train, test = y[:-holdout], y[-holdout:]
+
+        best_name, best_mae, best_rmse = "linear_trend", np.inf, 0.0
+        for name in MODEL_NAMES:
+            if len(train) < 2:
+                break
+            errors = test - ForecastingService._predict(name, train, holdout)
+            mae = np.abs(errors).mean()
+            if mae < best_mae:
+                best_name, best_mae = name, mae
+                best_rmse = float(np.sqrt((errors ** 2).mean()))
+
+        return best_name, best_rmse
+
+    @staticmethod
+    def forecast_series(
+        y: np.ndarray,
+        horizon: int,
+        periods: List[str],
+    ) -> Dict:
+        name, rmse = ForecastingService._select_model(y, horizon)
+        points = ForecastingService._predict(name, y, horizon)
+        spread = Z_95 * rmse * np.sqrt(np.arange(1, horizon + 1))
+
+        return {
+            "model": name,
+            "backtest_rmse": round(rmse, 2),
+            "points": [
+                {
+                    "period": period,
+                    "forecast": round(float(p), 2),
+                    "lower": round(float(p - s), 2),
+                    "upper": round(float(p + s), 2),
+                }
+                for period, p, s in zip(periods, points, spread)
+            ],
+        }
+
+    @staticmethod
+    def forecast(
+        df: pd.DataFrame,
+        horizon: int = 6,
+    ) -> Optional[Dict]:
+        """
+        Monthly point forecasts with 95% intervals for revenue, expenses
+        and cash flow in one pass. None with fewer than 3 months of data.
+        """
+        if "record_date" not in df.columns or df.empty:
+            return None
+
+        monthly = ForecastingService.monthly_series(df)
+        if len(monthly) < 3:
+            return None
+
+        last = monthly.index[-1]
+        periods = [
+            (last + pd.DateOffset(months=i)).strftime("%Y-%m")
+            for i in range(1, horizon + 1)
+        ]
+
+        return {
+            "frequency": "monthly",
+            "history_months": len(monthly),
+            "interpolated_months": int(monthly["interpolated"].sum()),
+            "series": {
+                col: ForecastingService.forecast_series(
+                    monthly[col].to_numpy(dtype=float), horizon, periods
+                )
+                for col in ("revenue", "expenses", "cash_flow")
+            },
+        }
+
     @staticmethod
     def forecast_revenue(
         df: pd.DataFrame,
         months: int = 6
     ) -> Dict[str, float]:
         """
-        Linear trend forecast (safe MVP)
+        Revenue point forecasts keyed month_1..month_n
         """
         if "revenue" not in df.columns:
             return {}
 
-        df = df.copy()
-        df["t"] = range(len(df))
-
-        coeffs = pd.Series(df["revenue"]).rolling(3).mean().dropna()
+        result = ForecastingService.forecast(df, horizon=months)
+        return ForecastingService.revenue_by_month(result)
 
-        if coeffs.empty:
+    @staticmethod
+    def revenue_by_month(result: Optional[Dict]) -> Dict[str, float]:
+        if not result:
             return {}
 
-        last_value = coeffs.iloc[-1]
-
-        forecast = {
-            f"month_{i+1}": round(last_value * (1 + 0.02 * i), 2)
-            for i in range(months)
-        }
-
-        return forecast
+        points = result["series"]["revenue"]["points"]
+        return {f"month_{i+1}": p["forecast"] for i, p in enumerate(points)}
@@ -0,0 +1,291 @@
+import time
+from io import StringIO
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.financial_data import FinancialData
+from app.services.file_parser import FileParser
+from app.services.metrics_store import MetricsStore
+from app.services.validation import UploadValidator
+
+
+# Monetary columns that default to 0 when missing from an upload
+DEFAULT_ZERO_COLUMNS = [
+    "revenue",
+    "expenses",
+    "profit",
+    "accounts_receivable",
+    "accounts_payable",
+    "loan_obligations",
+    "tax_paid",
+]
+
+# Monetary columns stored as NULL when missing
+NULLABLE_COLUMNS = ["inventory_value"]
+
+INSERT_COLUMNS = (
+    ["user_id", "record_date"]
+    + DEFAULT_ZERO_COLUMNS
+    + NULLABLE_COLUMNS
+    + ["source", "fingerprint"]
+)
+
+# Unique index used to skip rows that were already ingested
+CONFLICT_COLUMNS = ["user_id", "record_date", "fingerprint"]
+
+
+class IngestionError(ValueError):
+    pass
+
+
+class IngestionService:
+    @staticmethod
+    def to_columns(
+        df: pd.DataFrame,
+        user_id: int,
+        source: str = "upload",
+        seen: Optional[Dict[int, int]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Converts a normalized upload frame into typed column arrays
+        ready for a bulk insert into financial_data.
+        """
+        n = len(df)
+        columns: Dict[str, np.ndarray] = {
+            "user_id": np.full(n, user_id, dtype=np.int64),
+            "record_date": pd.to_datetime(df["record_date"]).dt.date.to_numpy(),
+            "source": np.full(n, source, dtype=object),
+        }
+
+        for col in DEFAULT_ZERO_COLUMNS:
+            if col in df.columns:
+                values = pd.to_numeric(df[col]).fillna(0.0)
+                columns[col] = values.to_numpy(dtype=np.float64)
+            else:
+                columns[col] = np.zeros(n, dtype=np.float64)
+
+        for col in NULLABLE_COLUMNS:
+            if col in df.columns:
+                values = pd.to_numeric(df[col]).astype(object)
+                columns[col] = values.where(values.notna(), None).to_numpy()
+            else:
+                columns[col] = np.full(n, None, dtype=object)
+
+        columns["fingerprint"] = IngestionService.fingerprints(columns, seen)
+        return columns
+
+    @staticmethod
+    def fingerprints(
+        columns: Dict[str, np.ndarray],
+        seen: Optional[Dict[int, int]] = None,
+    ) -> np.ndarray:
+        """
+        64-bit content hash of record_date and the monetary columns
+        (rounded to cents), computed vectorized over the whole chunk.
+
+        Identical rows within one upload (two equal withdrawals on the
+        same day) are told apart by their occurrence ordinal: the first
+        keeps the plain content hash, later ones hash (content, ordinal).
+        Re-uploading the file reproduces the same fingerprints. `seen`
+        carries the occurrence counts across chunks of one upload and is
+        updated in place.
+        """
+        frame = pd.DataFrame({
+            "record_date": pd.to_datetime(columns["record_date"]),
+            **{
+                col: np.round(columns[col].astype(np.float64), 2)
+                for col in DEFAULT_ZERO_COLUMNS + NULLABLE_COLUMNS
+            },
+        })
+        content = pd.Series(pd.util.hash_pandas_object(frame, index=False).to_numpy())
+
+        ordinal = content.groupby(content, sort=False).cumcount().to_numpy()
+        if seen:
+            ordinal = ordinal + content.map(seen).fillna(0).to_numpy(dtype=np.int64)
+        if seen is not None:
+            for value, count in content.value_counts(sort=False).items():
+                seen[value] = seen.get(value, 0) + count
+
+        hashed = content.to_numpy()
+        repeated = ordinal > 0
+        if repeated.any():
+            hashed[repeated] = pd.util.hash_pandas_object(
+                pd.DataFrame({"content": hashed[repeated], "ordinal": ordinal[repeated]}),
+                index=False,
+            ).to_numpy()
+        return hashed.view(np.int64)
+
+    @staticmethod
+    def iter_batches(
+        columns: Dict[str, np.ndarray],
+        batch_size: int,
+    ) -> Iterator[List[Dict]]:
+        n = len(columns["user_id"])
+        for start in range(0, n, batch_size):
+            stop = min(start + batch_size, n)
+            sliced = [columns[c][start:stop].tolist() for c in INSERT_COLUMNS]
+            yield [dict(zip(INSERT_COLUMNS, row)) for row in zip(*sliced)]
+
+    @staticmethod
+    def _insert_batches(
+        db: Session,
+        columns: Dict[str, np.ndarray],
+        batch_size: int,
+    ) -> np.ndarray:
+        """
+        executemany INSERT ... ON CONFLICT DO NOTHING, returning the
+        fingerprints of the rows actually written.
+        """
+        stmt = (
+            pg_insert(FinancialData)
+            .on_conflict_do_nothing(index_elements=CONFLICT_COLUMNS)
+            .returning(FinancialData.fingerprint)
+        )
+        inserted = []
+        for batch in IngestionService.iter_batches(columns, batch_size):
+            inserted.extend(db.execute(stmt, batch).scalars())
+        return np.array(inserted, dtype=np.int64)
+
+    @staticmethod
+    def _copy(db: Session, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        PostgreSQL COPY FROM STDIN into a temporary staging table, then a
+        single INSERT ... SELECT ... ON CONFLICT DO NOTHING. The fastest
+        path for very large files.
+        """
+        frame = pd.DataFrame({c: columns[c] for c in INSERT_COLUMNS})
+        buffer = StringIO()
+        frame.to_csv(buffer, index=False, header=False, na_rep="\\N")
+        buffer.seek(0)
+
+        table = FinancialData.__tablename__
+        column_list = ", ".join(INSERT_COLUMNS)
+
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {table}_staging "
+                f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cursor.execute(f"TRUNCATE {table}_staging")
+            cursor.copy_expert(
+                f"COPY {table}_staging ({column_list}) "
+                "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
+            )
+            cursor.execute(
+                f"INSERT INTO {table} ({column_list}) "
+                f"SELECT {column_list} FROM {table}_staging "
+                f"ON CONFLICT ({', '.join(CONFLICT_COLUMNS)}) DO NOTHING "
+                "RETURNING fingerprint"
+            )
+            inserted = [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+        return np.array(inserted, dtype=np.int64)
+
+    @staticmethod
+    def bulk_insert(
+        db: Session,
+        df: pd.DataFrame,
+        user_id: int,
+        source: str = "upload",
+        batch_size: int | None = None,
+        use_copy: bool | None = None,
+        seen: Optional[Dict[int, int]] = None,
+    ) -> Dict[str, float]:
+        """
+        Writes the frame column-wise via executemany batches (or COPY).
+        The caller owns the transaction and is responsible for commit.
+        Pass the same `seen` dict for every chunk of one upload (see
+        fingerprints).
+        """
+        batch_size = batch_size or settings.UPLOAD_BATCH_SIZE
+        if use_copy is None:
+            use_copy = settings.UPLOAD_USE_COPY
+
+        started = time.perf_counter()
+        columns = IngestionService.to_columns(df, user_id, source, seen)
+
+        if use_copy:
+            inserted = IngestionService._copy(db, columns)
+        else:
+            inserted = IngestionService._insert_batches(db, columns, batch_size)
+
+        # Only rows that were not already stored count towards the totals
+        written = pd.DataFrame(columns)
+        written = written[np.isin(columns["fingerprint"], inserted)]
+        MetricsStore.add(db, user_id, written)
+
+        stats = IngestionService.stats(len(written), time.perf_counter() - started)
+        stats["rows_deduplicated"] = len(df) - len(written)
+        return stats
+
+    @staticmethod
+    def ingest_chunks(
+        db: Session,
+        chunks: Iterable[pd.DataFrame],
+        user_id: int,
+        source: str = "upload",
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Dict[str, float]:
+        """
+        Normalizes, validates and inserts a stream of DataFrame chunks so
+        only one chunk is held in memory at a time. Invalid rows are
+        skipped and reported. Commit is left to the caller.
+        `on_progress` is called with the running row count after each chunk.
+        """
+        started = time.perf_counter()
+        rows = 0
+        deduplicated = 0
+        rejected = 0
+        parsed = 0
+        errors: List[Dict] = []
+        chunk_count = 0
+        seen: Dict[int, int] = {}
+
+        for df in chunks:
+            df = UploadValidator.apply_aliases(FileParser.normalize_columns(df))
+            if "record_date" not in df.columns:
+                raise IngestionError("record_date column is required")
+            if df.empty:
+                continue
+
+            valid, chunk_rejected, chunk_errors = UploadValidator.validate(
+                df,
+                row_offset=parsed,
+                max_errors=settings.UPLOAD_MAX_REPORTED_ERRORS - len(errors),
+            )
+            parsed += len(df)
+            rejected += chunk_rejected
+            errors.extend(chunk_errors)
+
+            if not valid.empty:
+                chunk_stats = IngestionService.bulk_insert(
+                    db, valid, user_id, source, seen=seen
+                )
+                rows += chunk_stats["rows_inserted"]
+                deduplicated += chunk_stats["rows_deduplicated"]
+            chunk_count += 1
+            if on_progress:
+                on_progress(rows)
+
+        stats = IngestionService.stats(rows, time.perf_counter() - started)
+        stats["rows_deduplicated"] = deduplicated
+        stats["rows_rejected"] = rejected
+        stats["errors"] = errors
+        stats["chunks"] = chunk_count
+        return stats
+
+    @staticmethod
+    def stats(rows: int, elapsed: float) -> Dict[str, float]:
+        return {
+            "rows_inserted": rows,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(rows / elapsed, 1) if elapsed > 0 else float(rows),
+        }
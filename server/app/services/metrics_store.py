@@ -0,0 +1,143 @@
+from datetime import date
+from typing import Dict, Optional
+
+import pandas as pd
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.financial_aggregate import UserFinancialAggregate
+from app.services.finance_analysis import FinanceAnalyzer, TOTAL_COLUMNS
+
+# First key of the two-key advisory locks serializing aggregate
+# creation per user (the second key is the user id)
+AGGREGATE_LOCK_NAMESPACE = 4101
+
+
+class MetricsStore:
+    """
+    Maintains user_financial_aggregates incrementally at ingestion time
+    and serves per-user totals from it.
+    """
+
+    @staticmethod
+    def get(db: Session, user_id: int) -> Optional[Dict]:
+        table = UserFinancialAggregate.__table__
+        row = db.execute(
+            select(table).where(table.c.user_id == user_id)
+        ).first()
+        if row is None:
+            return None
+
+        totals = dict(row._mapping)
+        totals.pop("user_id")
+        totals.pop("updated_at")
+        return totals
+
+    @staticmethod
+    def data_version(db: Session, user_id: int) -> int:
+        table = UserFinancialAggregate.__table__
+        version = db.execute(
+            select(table.c.data_version).where(table.c.user_id == user_id)
+        ).scalar()
+        return version or 0
+
+    @staticmethod
+    def lock(db: Session, user_id: int) -> None:
+        """
+        Serializes aggregate writers for one user until the transaction
+        ends, so two first uploads cannot both rebuild from a snapshot
+        missing the other's rows.
+        """
+        db.execute(
+            text("SELECT pg_advisory_xact_lock(:namespace, :user_id)"),
+            {"namespace": AGGREGATE_LOCK_NAMESPACE, "user_id": user_id},
+        )
+
+    @staticmethod
+    def rebuild(db: Session, user_id: int, bump: bool = True) -> Dict:
+        """
+        Recomputes the aggregate from financial_data, used to backfill
+        users whose data predates the aggregate table. With bump=False a
+        newly created aggregate keeps data_version 0: nothing changed
+        since callers read that version (no row), so report cache
+        entries keyed on it stay valid.
+        """
+        values = FinanceAnalyzer.sql_totals(db, user_id) or {
+            **{col: 0.0 for col in TOTAL_COLUMNS},
+            "row_count": 0,
+            "min_date": None,
+            "max_date": None,
+        }
+        table = UserFinancialAggregate.__table__
+        stmt = pg_insert(table).values(user_id=user_id, data_version=int(bump), **values)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.user_id],
+                set_={
+                    **{key: stmt.excluded[key] for key in values},
+                    "data_version": table.c.data_version + 1,
+                },
+            )
+        )
+        return values
+
+    @staticmethod
+    def add(db: Session, user_id: int, df: pd.DataFrame) -> None:
+        """
+        Folds freshly inserted rows (typed frame with record_date and the
+        monetary columns) into the user's running totals.
+        """
+        if df.empty:
+            return
+
+        # Held until commit: a concurrent first upload for the same user
+        # waits here, then sees the committed aggregate and adds to it
+        MetricsStore.lock(db, user_id)
+        if MetricsStore.get(db, user_id) is None:
+            # First aggregate for this user: the rows just inserted are
+            # already visible in this transaction, so rebuild covers them.
+            MetricsStore.rebuild(db, user_id)
+            return
+
+        totals = FinanceAnalyzer.totals_from_frame(df)
+        dates = pd.to_datetime(df["record_date"])
+        table = UserFinancialAggregate.__table__
+
+        db.execute(
+            table.update()
+            .where(table.c.user_id == user_id)
+            .values(
+                **{col: table.c[col] + totals[col] for col in TOTAL_COLUMNS},
+                row_count=table.c.row_count + len(df),
+                min_date=func.least(table.c.min_date, dates.min().date()),
+                max_date=func.greatest(table.c.max_date, dates.max().date()),
+                data_version=table.c.data_version + 1,
+            )
+        )
+
+    @staticmethod
+    def load_totals(
+        db: Session,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Optional[Dict]:
+        """
+        Returns the user's totals, backfilling the aggregate if needed.
+        Date-range requests (or METRICS_ENGINE=sql) are answered by a
+        SQL SUM query instead. None when the user has no financial data.
+        """
+        if start_date or end_date or settings.METRICS_ENGINE == "sql":
+            return FinanceAnalyzer.sql_totals(db, user_id, start_date, end_date)
+
+        totals = MetricsStore.get(db, user_id)
+        if totals is None:
+            MetricsStore.lock(db, user_id)
+            totals = MetricsStore.get(db, user_id) or MetricsStore.rebuild(db, user_id, bump=False)
+            db.commit()
+
+        if not totals["row_count"]:
+            return None
+        return totals
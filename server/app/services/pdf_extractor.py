@@ -0,0 +1,317 @@
+import hashlib
+import json
+import os
+import re
+from bisect import bisect
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from PyPDF2 import PdfReader
+
+from app.core.config import settings
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Bump when the cached page format or row grouping changes
+EXTRACTOR_VERSION = 1
+
+# Text fragments whose baselines differ by less than this (in points)
+# belong to the same table row
+ROW_TOLERANCE = 2.0
+
+# Statement headings -> FinancialData (or pass-through) columns
+HEADER_ALIASES = {
+    "date": "record_date",
+    "txn date": "record_date",
+    "transaction date": "record_date",
+    "value date": "value_date",
+    "posting date": "record_date",
+    "record date": "record_date",
+    "description": "description",
+    "narration": "description",
+    "particulars": "description",
+    "details": "description",
+    "remarks": "description",
+    "debit": "expenses",
+    "withdrawal": "expenses",
+    "withdrawals": "expenses",
+    "withdrawal amt": "expenses",
+    "paid out": "expenses",
+    "expenses": "expenses",
+    "credit": "revenue",
+    "deposit": "revenue",
+    "deposits": "revenue",
+    "deposit amt": "revenue",
+    "paid in": "revenue",
+    "revenue": "revenue",
+    "amount": "amount",
+    "balance": "balance",
+    "closing balance": "balance",
+    "ref no": "reference",
+    "reference": "reference",
+    "cheque no": "reference",
+    "chq no": "reference",
+}
+
+TEXT_COLUMNS = {"description", "reference"}
+
+DATE_FORMATS = [
+    "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y", "%Y-%m-%d",
+    "%d/%m/%y", "%d-%m-%y", "%d %b %Y", "%d-%b-%Y",
+    "%d %b %y", "%d-%b-%y", "%m/%d/%Y", "%b %d, %Y",
+]
+
+_AMOUNT_JUNK = re.compile(r"(?i)[^\d.\-]|cr|dr")
+
+_LONGEST_HEADING = max(len(h) for h in HEADER_ALIASES) + 4
+
+
+@lru_cache(maxsize=4096)
+def _heading(text: str) -> Optional[str]:
+    # Cheap reject for dates, amounts and long descriptions
+    if len(text) > _LONGEST_HEADING or not text[0].isalpha():
+        return None
+    return HEADER_ALIASES.get(re.sub(r"[^a-z ]", "", text.lower()).strip())
+
+
+# A page is a list of rows, a row a list of (x, text) cells sorted by x
+Page = List[List[Tuple[float, str]]]
+
+
+def _page_rows(page) -> Page:
+    """
+    Positions every text fragment via the visitor_text callback and
+    groups fragments into rows by baseline, top to bottom.
+    """
+    fragments = []
+
+    def visit(text, cm, tm, font_dict, font_size):
+        text = text.strip()
+        if not text:
+            return
+        # Text space -> page space: tm translated by the current matrix
+        x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+        y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+        fragments.append((y, x, text))
+
+    page.extract_text(visitor_text=visit)
+
+    rows: Page = []
+    row_y = None
+    for y, x, text in sorted(fragments, key=lambda f: (-f[0], f[1])):
+        if row_y is None or row_y - y > ROW_TOLERANCE:
+            rows.append([])
+            row_y = y
+        rows[-1].append((round(x, 1), text))
+    for row in rows:
+        row.sort()
+    return rows
+
+
+def _extract_page_range(file_bytes: bytes, start: int, stop: int) -> List[Page]:
+    """
+    Process pool entry point.
+    """
+    reader = PdfReader(BytesIO(file_bytes))
+    return [_page_rows(reader.pages[i]) for i in range(start, stop)]
+
+
+class PdfStatementExtractor:
+    """
+    Reconstructs transaction tables from text-based PDF statements using
+    the x position of each text fragment, maps the headings to
+    FinancialData columns and infers date and amount types.
+    """
+
+    @staticmethod
+    def extract_pages(file_bytes: bytes, workers: Optional[int] = None) -> List[Page]:
+        page_count = len(PdfReader(BytesIO(file_bytes)).pages)
+        workers = workers or settings.PDF_WORKERS
+
+        if workers <= 1 or page_count < settings.PDF_PARALLEL_MIN_PAGES:
+            return _extract_page_range(file_bytes, 0, page_count)
+
+        # A few contiguous ranges per worker to even out slow pages
+        bounds = np.linspace(0, page_count, min(page_count, workers * 4) + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_extract_page_range, file_bytes, int(start), int(stop))
+                for start, stop in zip(bounds[:-1], bounds[1:])
+                if stop > start
+            ]
+            return [page for future in futures for page in future.result()]
+
+    @staticmethod
+    def _cache_path(digest: str) -> Path:
+        return Path(settings.PDF_CACHE_DIR) / f"{digest}.v{EXTRACTOR_VERSION}.json"
+
+    @staticmethod
+    def _cache_get(digest: str) -> Optional[List[Page]]:
+        path = PdfStatementExtractor._cache_path(digest)
+        try:
+            with open(path, "r") as f:
+                pages = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable PDF page cache %s: %s", path, exc)
+            return None
+        return pages
+
+    @staticmethod
+    def _cache_put(digest: str, pages: List[Page]) -> None:
+        directory = Path(settings.PDF_CACHE_DIR)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            path = PdfStatementExtractor._cache_path(digest)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w") as f:
+                json.dump(pages, f, separators=(",", ":"))
+            tmp.replace(path)
+
+            # Keep the newest PDF_CACHE_MAX_FILES entries
+            entries = sorted(directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+            for stale in entries[:-settings.PDF_CACHE_MAX_FILES]:
+                stale.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning("Could not write PDF page cache: %s", exc)
+
+    @staticmethod
+    def header_columns(row: List[Tuple[float, str]]) -> Optional[List[Tuple[float, str]]]:
+        """
+        (x, column) anchors if the row looks like a table heading: at
+        least two known headings, one of them the transaction date.
+        """
+        anchors = []
+        for x, text in row:
+            column = _heading(text)
+            if column:
+                anchors.append((x, column))
+        columns = [c for _, c in anchors]
+        if len(anchors) >= 2 and "record_date" in columns:
+            return anchors
+        return None
+
+    @staticmethod
+    def table_rows(pages: List[Page]) -> Tuple[List[str], List[List[Optional[str]]]]:
+        """
+        Assigns each cell to the nearest heading by x. Headings repeated
+        on later pages are re-detected, pages without one reuse the last.
+        """
+        anchors = None
+        columns: List[str] = []
+        records: List[List[Optional[str]]] = []
+
+        for page in pages:
+            for row in page:
+                header = PdfStatementExtractor.header_columns(row)
+                if header:
+                    # A cell belongs to the heading whose x is nearest,
+                    # i.e. split the row at the midpoints between headings
+                    xs = [x for x, _ in header]
+                    anchors = [(a + b) / 2.0 for a, b in zip(xs, xs[1:])]
+                    for _, column in header:
+                        if column not in columns:
+                            columns.append(column)
+                    slots = [columns.index(column) for _, column in header]
+                    continue
+                if anchors is None:
+                    continue
+
+                record: List[Optional[str]] = [None] * len(columns)
+                for x, text in row:
+                    slot = slots[bisect(anchors, x)]
+                    record[slot] = text if record[slot] is None else f"{record[slot]} {text}"
+                records.append(record)
+
+        width = len(columns)
+        return columns, [r + [None] * (width - len(r)) for r in records]
+
+    @staticmethod
+    def parse_dates(values: pd.Series) -> pd.Series:
+        """
+        Picks the format that parses most of a sample, then converts the
+        whole column with it.
+        """
+        sample = values.dropna().head(200)
+        if sample.empty:
+            return pd.to_datetime(values, errors="coerce")
+
+        best, best_count = None, 0
+        for fmt in DATE_FORMATS:
+            count = pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum()
+            if count > best_count:
+                best, best_count = fmt, count
+
+        if best is None:
+            return pd.to_datetime(values, errors="coerce")
+        return pd.to_datetime(values, format=best, errors="coerce")
+
+    @staticmethod
+    def parse_amounts(values: pd.Series) -> pd.Series:
+        """
+        Strips currency symbols, thousands separators and Cr/Dr markers;
+        (1,234.00) is negative.
+        """
+        text = values.astype("string").str.strip()
+        negative = text.str.startswith("(") & text.str.endswith(")")
+        amounts = pd.to_numeric(text.str.replace(_AMOUNT_JUNK, "", regex=True), errors="coerce")
+        amounts = amounts.where(~negative.fillna(False), -amounts.abs())
+        return pd.Series(
+            amounts.to_numpy(dtype=np.float64, na_value=np.nan), index=values.index
+        )
+
+    @staticmethod
+    def to_frame(columns: List[str], records: List[List[Optional[str]]]) -> pd.DataFrame:
+        df = pd.DataFrame(records, columns=columns)
+        if df.empty:
+            return df
+
+        df["record_date"] = PdfStatementExtractor.parse_dates(df["record_date"])
+        # Wrapped descriptions, page footers and totals have no date
+        df = df[df["record_date"].notna()].reset_index(drop=True)
+
+        for column in df.columns:
+            if column == "record_date" or column in TEXT_COLUMNS:
+                continue
+            if column == "value_date":
+                df[column] = PdfStatementExtractor.parse_dates(df[column])
+                continue
+
+            amounts = PdfStatementExtractor.parse_amounts(df[column])
+            present = df[column].notna().sum()
+            # Only treat the column as numeric if nearly every value parses
+            if present == 0 or amounts.notna().sum() >= 0.9 * present:
+                df[column] = amounts
+
+        return df
+
+    @staticmethod
+    def extract(
+        file_bytes: bytes,
+        workers: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+    ) -> pd.DataFrame:
+        if use_cache is None:
+            use_cache = settings.PDF_CACHE_ENABLED
+
+        pages = None
+        if use_cache:
+            digest = hashlib.sha256(file_bytes).hexdigest()
+            pages = PdfStatementExtractor._cache_get(digest)
+
+        if pages is None:
+            pages = PdfStatementExtractor.extract_pages(file_bytes, workers)
+            if use_cache:
+                PdfStatementExtractor._cache_put(digest, pages)
+
+        columns, records = PdfStatementExtractor.table_rows(pages)
+        if not columns:
+            raise ValueError("No transaction table found in PDF")
+        return PdfStatementExtractor.to_frame(columns, records)
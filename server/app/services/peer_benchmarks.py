@@ -0,0 +1,171 @@
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.financial_aggregate import UserFinancialAggregate
+from app.models.user import User
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+PEER_METRICS = ["profit_margin", "debt_to_revenue", "working_capital"]
+
+# Quantile grid of each sketch: values at the 0th, 1st, ... 100th percentile
+LEVELS = np.linspace(0.0, 100.0, 101)
+
+
+class PeerSketch:
+    """
+    Fixed-size quantile sketch of one metric across an industry. Memory
+    and lookup cost do not depend on the number of tenants.
+    """
+
+    __slots__ = ("quantiles", "population")
+
+    def __init__(self, values: np.ndarray):
+        self.quantiles = np.quantile(values, LEVELS / 100.0)
+        self.population = len(values)
+
+    def percentile_rank(self, value: float) -> float:
+        """
+        Binary search on the quantile grid. Ties take the middle of the
+        run of equal quantiles, so a population of identical values ranks 50.
+        """
+        lo = np.searchsorted(self.quantiles, value, side="left")
+        hi = np.searchsorted(self.quantiles, value, side="right")
+        if hi == 0:
+            return 0.0
+        if lo == len(LEVELS):
+            return 100.0
+        if lo == hi:
+            # Between two grid points, interpolate linearly
+            left, right = self.quantiles[lo - 1], self.quantiles[lo]
+            position = lo - 1 + (value - left) / (right - left)
+        else:
+            position = (lo + hi - 1) / 2.0
+        return round(float(position * 100.0 / (len(LEVELS) - 1)), 1)
+
+
+class PeerBenchmarks:
+    """
+    Percentile ranks of a user's metrics against every other tenant in
+    the same industry, from sketches built off user_financial_aggregates
+    and refreshed every PEER_BENCHMARK_REFRESH_SECONDS.
+    """
+
+    _sketches: Mapping[str, Mapping[str, PeerSketch]] = MappingProxyType({})
+    _refreshed_at: Optional[float] = None
+    generation = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def population_metrics(db: Session) -> pd.DataFrame:
+        """
+        One row per tenant with data: industry plus the peer metrics,
+        computed the same way as FinanceAnalyzer.metrics_from_totals.
+        """
+        agg = UserFinancialAggregate
+        rows = db.execute(
+            select(
+                func.lower(func.trim(User.industry)).label("industry"),
+                agg.revenue,
+                agg.expenses,
+                agg.accounts_receivable,
+                agg.accounts_payable,
+                agg.inventory_value,
+                agg.loan_obligations,
+            )
+            .join(User, User.id == agg.user_id)
+            .where(agg.row_count > 0, User.industry.isnot(None), User.industry != "")
+        ).all()
+
+        frame = pd.DataFrame(rows, columns=[
+            "industry", "revenue", "expenses", "accounts_receivable",
+            "accounts_payable", "inventory_value", "loan_obligations",
+        ])
+        money = frame.columns.drop("industry")
+        frame[money] = frame[money].astype(np.float64).fillna(0.0)
+
+        revenue = frame["revenue"].to_numpy()
+        has_revenue = revenue != 0
+        safe_revenue = np.where(has_revenue, revenue, 1.0)
+
+        profit = revenue - frame["expenses"].to_numpy()
+        return pd.DataFrame({
+            "industry": frame["industry"],
+            "profit_margin": np.where(has_revenue, np.round(profit / safe_revenue, 4), 0.0),
+            "debt_to_revenue": np.where(
+                has_revenue, np.round(frame["loan_obligations"].to_numpy() / safe_revenue, 4), 0.0
+            ),
+            "working_capital": np.round(
+                frame["accounts_receivable"] + frame["inventory_value"] - frame["accounts_payable"], 2
+            ),
+        })
+
+    @classmethod
+    def refresh(cls, db: Session) -> None:
+        started = time.perf_counter()
+        population = cls.population_metrics(db)
+
+        sketches = {}
+        for industry, group in population.groupby("industry", sort=False):
+            # Too few peers makes a rank meaningless and could expose
+            # individual tenants' figures
+            if len(group) < settings.PEER_BENCHMARK_MIN_POPULATION:
+                continue
+            sketches[industry] = MappingProxyType({
+                metric: PeerSketch(group[metric].to_numpy()) for metric in PEER_METRICS
+            })
+
+        cls._sketches = MappingProxyType(sketches)
+        cls._refreshed_at = time.monotonic()
+        cls.generation += 1
+        logger.info(
+            "Refreshed peer benchmarks for %s industries from %s tenants in %.3fs",
+            len(sketches), len(population), time.perf_counter() - started,
+        )
+
+    @classmethod
+    def _stale(cls) -> bool:
+        return (
+            cls._refreshed_at is None
+            or time.monotonic() - cls._refreshed_at >= settings.PEER_BENCHMARK_REFRESH_SECONDS
+        )
+
+    @classmethod
+    def sketches(cls, db: Session) -> Mapping[str, Mapping[str, PeerSketch]]:
+        # Only one request rebuilds, the rest keep serving the old
+        # sketches (or wait, if there are none yet)
+        if cls._stale() and cls._lock.acquire(blocking=cls._refreshed_at is None):
+            try:
+                if cls._stale():
+                    cls.refresh(db)
+            finally:
+                cls._lock.release()
+        return cls._sketches
+
+    @classmethod
+    def version(cls, db: Session) -> int:
+        cls.sketches(db)
+        return cls.generation
+
+    @staticmethod
+    def percentile_ranks(db: Session, metrics: Dict[str, float], industry: str) -> Dict:
+        industry_sketches = PeerBenchmarks.sketches(db).get(industry.strip().lower())
+        if not industry_sketches:
+            return {}
+
+        ranks = {
+            metric: sketch.percentile_rank(metrics[metric])
+            for metric, sketch in industry_sketches.items()
+            if metrics.get(metric) is not None
+        }
+        ranks["population"] = industry_sketches[PEER_METRICS[0]].population
+        return ranks
@@ -0,0 +1,230 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Tuple
+
+# Each tolerance-matching pass considers at most this many free book
+# entries below and above the bank amount per day, nearest amounts first
+CANDIDATES_PER_SIDE = 4
+
+
+class ReconciliationEngine:
+    """
+    One-to-one bank-to-books matching. Exact (date, amount) matches are
+    paired with a hash join that ranks duplicate keys, so repeated
+    entries pair up one by one instead of multiplying. The leftovers are
+    matched within a date window and amount tolerance: candidates come
+    from binary searches on a sorted (day, amount) key, one per day
+    offset, so each lookup is bounded by the entries on that day.
+    Entries left without a partner are searched again against the
+    remaining books, so duplicate amounts still pair up one by one.
+    """
+
+    @staticmethod
+    def _prepare(df: pd.DataFrame, date_col: str, amount_col: str) -> pd.DataFrame:
+        return pd.DataFrame({
+            "row": np.arange(len(df)),
+            "date": pd.to_datetime(df[date_col]).dt.normalize().to_numpy(),
+            # Integer cents avoid float equality issues in the join
+            "cents": np.round(pd.to_numeric(df[amount_col]).to_numpy() * 100).astype(np.int64),
+        })
+
+    @staticmethod
+    def _exact_pairs(bank: pd.DataFrame, books: pd.DataFrame) -> pd.DataFrame:
+        bank = bank.assign(occurrence=bank.groupby(["date", "cents"]).cumcount())
+        books = books.assign(occurrence=books.groupby(["date", "cents"]).cumcount())
+        pairs = bank.merge(
+            books,
+            on=["date", "cents", "occurrence"],
+            suffixes=("_bank", "_books"),
+        )
+        return pd.DataFrame({
+            "bank_row": pairs["row_bank"].to_numpy(),
+            "books_row": pairs["row_books"].to_numpy(),
+            "amount_difference": 0.0,
+            "days_apart": 0,
+        })
+
+    @staticmethod
+    def _candidates(
+        bank_keys: np.ndarray,
+        book_keys: np.ndarray,
+        span: int,
+        window_days: int,
+        tolerance_cents: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Candidate (bank, book) index pairs: per day offset in the window,
+        the nearest few book amounts on either side within the tolerance.
+        Bank entries sharing a key are ranked, like duplicates in
+        _exact_pairs, and the r-th one looks r positions further out, so
+        duplicates spread over the books instead of all competing for
+        the same few. book_keys must be sorted.
+        """
+        order = np.argsort(bank_keys, kind="stable")
+        sorted_keys = bank_keys[order]
+        run_starts = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+        first = np.maximum.accumulate(np.where(run_starts, np.arange(len(order)), 0))
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order)) - first
+
+        cand_bank, cand_book = [], []
+        for offset in range(-window_days, window_days + 1):
+            keys = bank_keys + offset * span
+            lows = np.searchsorted(book_keys, keys - tolerance_cents, side="left")
+            highs = np.searchsorted(book_keys, keys + tolerance_cents, side="right")
+            nearest = np.searchsorted(book_keys, keys, side="left")
+
+            # Below and above the amount, shifted out by the rank
+            for center in (nearest - rank, nearest + rank):
+                window_lows = np.maximum(lows, center - CANDIDATES_PER_SIDE)
+                window_highs = np.minimum(highs, center + CANDIDATES_PER_SIDE)
+
+                counts = np.clip(window_highs - window_lows, 0, None)
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+                starts = np.repeat(window_lows - (np.cumsum(counts) - counts), counts)
+                cand_bank.append(np.repeat(np.arange(len(bank_keys)), counts))
+                cand_book.append(starts + np.arange(total))
+
+        if not cand_bank:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        return np.concatenate(cand_bank), np.concatenate(cand_book)
+
+    @staticmethod
+    def _tolerance_pairs(
+        bank: pd.DataFrame,
+        books: pd.DataFrame,
+        window_days: int,
+        tolerance_cents: int,
+    ) -> pd.DataFrame:
+        books = books.sort_values(["date", "cents"], kind="mergesort")
+
+        bank_rows = bank["row"].to_numpy()
+        bank_cents = bank["cents"].to_numpy()
+        bank_days = bank["date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+
+        book_rows = books["row"].to_numpy()
+        book_cents = books["cents"].to_numpy()
+        book_days = books["date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+
+        # (day, cents) packed into one sorted int64 key, so the books on
+        # a given day within the amount tolerance are one searchsorted range
+        base_day = int(min(bank_days.min(), book_days.min())) - window_days
+        base_cents = int(min(bank_cents.min(), book_cents.min())) - tolerance_cents
+        span = int(max(bank_cents.max(), book_cents.max())) + tolerance_cents - base_cents + 1
+        day_count = int(max(bank_days.max(), book_days.max())) + window_days - base_day + 1
+        if span * day_count >= 2 ** 62:
+            raise ValueError("Amounts out of range")
+
+        book_keys = (book_days - base_day) * span + (book_cents - base_cents)
+        bank_keys = (bank_days - base_day) * span + (bank_cents - base_cents)
+
+        bank_used = np.zeros(len(bank_rows), dtype=bool)
+        book_used = np.zeros(len(book_rows), dtype=bool)
+        matched_bank, matched_book = [], []
+
+        # Candidates are capped to the nearest free books, so entries with
+        # equal keys compete for the same few. Entries that lose out are
+        # searched again against the books still free, until none of them
+        # has a candidate left. Each pass settles at least one pair.
+        pending = np.arange(len(bank_rows))
+        while len(pending):
+            free_books = np.flatnonzero(~book_used)
+            cand_bank, cand_book = ReconciliationEngine._candidates(
+                bank_keys[pending], book_keys[free_books], span, window_days, tolerance_cents
+            )
+            if not len(cand_bank):
+                break
+            cand_bank, cand_book = pending[cand_bank], free_books[cand_book]
+
+            amount_cost = np.abs(book_cents[cand_book] - bank_cents[cand_bank])
+            day_cost = np.abs(book_days[cand_book] - bank_days[cand_bank])
+            order = np.lexsort((cand_book, cand_bank, day_cost, amount_cost))
+            cand_bank, cand_book = cand_bank[order], cand_book[order]
+            contenders = cand_bank
+
+            # Greedy cheapest-first one-to-one assignment, vectorized in
+            # rounds: every bank entry proposes its cheapest free candidate,
+            # every book entry accepts the cheapest proposal. Each round
+            # settles at least the globally cheapest remaining pair.
+            while len(cand_bank):
+                free = ~bank_used[cand_bank] & ~book_used[cand_book]
+                cand_bank, cand_book = cand_bank[free], cand_book[free]
+                if not len(cand_bank):
+                    break
+                _, proposals = np.unique(cand_bank, return_index=True)
+                proposals.sort()
+                _, accepted = np.unique(cand_book[proposals], return_index=True)
+                chosen = proposals[accepted]
+
+                bank_used[cand_bank[chosen]] = True
+                book_used[cand_book[chosen]] = True
+                matched_bank.append(cand_bank[chosen])
+                matched_book.append(cand_book[chosen])
+
+            pending = np.unique(contenders[~bank_used[contenders]])
+
+        if not matched_bank:
+            return pd.DataFrame(columns=["bank_row", "books_row", "amount_difference", "days_apart"])
+
+        matched_bank = np.concatenate(matched_bank)
+        matched_book = np.concatenate(matched_book)
+        return pd.DataFrame({
+            "bank_row": bank_rows[matched_bank],
+            "books_row": book_rows[matched_book],
+            "amount_difference": (book_cents[matched_book] - bank_cents[matched_bank]) / 100,
+            "days_apart": book_days[matched_book] - bank_days[matched_bank],
+        })
+
+    @staticmethod
+    def match(
+        bank_df: pd.DataFrame,
+        books_df: pd.DataFrame,
+        date_window_days: int = 0,
+        amount_tolerance: float = 0.0,
+        date_col: str = "record_date",
+        amount_col: str = "amount",
+    ) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+        """
+        Returns (pairs, unmatched_bank_rows, unmatched_books_rows) where
+        rows are 0-based positions in the input frames.
+        """
+        bank = ReconciliationEngine._prepare(bank_df, date_col, amount_col)
+        books = ReconciliationEngine._prepare(books_df, date_col, amount_col)
+
+        pairs = ReconciliationEngine._exact_pairs(bank, books)
+
+        tolerance_cents = int(round(amount_tolerance * 100))
+        if date_window_days > 0 or tolerance_cents > 0:
+            rest_bank = bank[~bank["row"].isin(pairs["bank_row"])]
+            rest_books = books[~books["row"].isin(pairs["books_row"])]
+            if len(rest_bank) and len(rest_books):
+                pairs = pd.concat(
+                    [
+                        pairs,
+                        ReconciliationEngine._tolerance_pairs(
+                            rest_bank, rest_books, date_window_days, tolerance_cents
+                        ),
+                    ],
+                    ignore_index=True,
+                )
+
+        unmatched_bank = np.setdiff1d(bank["row"].to_numpy(), pairs["bank_row"].to_numpy())
+        unmatched_books = np.setdiff1d(books["row"].to_numpy(), pairs["books_row"].to_numpy())
+        return pairs, unmatched_bank, unmatched_books
+
+    @staticmethod
+    def summary(
+        bank_df: pd.DataFrame,
+        books_df: pd.DataFrame,
+        pairs: pd.DataFrame,
+    ) -> Dict[str, int]:
+        return {
+            "bank_transactions": len(bank_df),
+            "book_entries": len(books_df),
+            "matched": len(pairs),
+            "unmatched_bank": len(bank_df) - len(pairs),
+            "unmatched_books": len(books_df) - len(pairs),
+        }
@@ -0,0 +1,128 @@
+import importlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+
+class CacheBackend(ABC):
+    """
+    Minimal interface for report cache storage. Alternative backends
+    (e.g. Redis) can be plugged in via REPORT_CACHE_BACKEND="module.Class".
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class MemoryLRUBackend(CacheBackend):
+    """
+    In-process LRU with per-entry TTL.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _build_backend() -> CacheBackend:
+    if settings.REPORT_CACHE_BACKEND == "memory":
+        return MemoryLRUBackend(settings.REPORT_CACHE_SIZE)
+
+    module_path, _, class_name = settings.REPORT_CACHE_BACKEND.rpartition(".")
+    return getattr(importlib.import_module(module_path), class_name)()
+
+
+class ReportCache:
+    """
+    Caches computed report responses keyed on the user's data version,
+    which is bumped on every upload, so stale entries are never served.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(user_id: int, report_type: str, data_version: int, **params) -> str:
+        params_part = json.dumps(params, sort_keys=True, default=str)
+        return f"report:{user_id}:{report_type}:v{data_version}:{params_part}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        if not settings.REPORT_CACHE_ENABLED:
+            return None
+
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Dict) -> None:
+        if settings.REPORT_CACHE_ENABLED:
+            self.backend.set(key, value, self.ttl)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.__class__.__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+report_cache = ReportCache(_build_backend(), settings.REPORT_CACHE_TTL_SECONDS)
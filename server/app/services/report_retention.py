@@ -0,0 +1,149 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Arbitrary key for pg_try_advisory_lock, so only one process compacts
+COMPACTION_LOCK_ID = 7254013
+
+# Per (user, report_type): the newest `keep` reports stay untouched.
+# Older reports are bucketed by day while younger than `daily_days`,
+# by month after that, and only the newest report of each bucket is
+# kept as the snapshot for it. snapshot_count accumulates how many
+# reports a snapshot stands for, across repeated compactions.
+COMPACT_SQL = """
+WITH ranked AS (
+    SELECT
+        id, user_id, report_type, created_at,
+        COALESCE(snapshot_count, 1) AS represents,
+        row_number() OVER (
+            PARTITION BY user_id, report_type ORDER BY created_at DESC, id DESC
+        ) AS recency,
+        created_at >= now() - make_interval(days => :daily_days) AS recent
+    FROM reports
+    WHERE user_id = ANY(:user_ids)
+),
+candidates AS (
+    SELECT
+        id, user_id, report_type, created_at, represents,
+        CASE WHEN recent THEN 'daily' ELSE 'monthly' END AS granularity,
+        date_trunc(CASE WHEN recent THEN 'day' ELSE 'month' END, created_at) AS bucket
+    FROM ranked
+    WHERE recency > :keep
+),
+bucketed AS (
+    SELECT
+        id, granularity,
+        row_number() OVER (newest_first) AS position,
+        sum(represents) OVER (same_bucket) AS represented
+    FROM candidates
+    WINDOW same_bucket AS (PARTITION BY user_id, report_type, granularity, bucket),
+           newest_first AS (same_bucket ORDER BY created_at DESC, id DESC)
+),
+snapshots AS (
+    UPDATE reports r
+    SET snapshot = b.granularity, snapshot_count = b.represented
+    FROM bucketed b
+    WHERE r.id = b.id AND b.position = 1
+      AND (r.snapshot IS DISTINCT FROM b.granularity
+           OR r.snapshot_count IS DISTINCT FROM b.represented)
+    RETURNING r.id
+),
+removed AS (
+    DELETE FROM reports r
+    USING bucketed b
+    WHERE r.id = b.id AND b.position > 1
+    RETURNING r.id
+)
+SELECT
+    (SELECT count(*) FROM snapshots) AS snapshots,
+    (SELECT count(*) FROM removed) AS removed
+"""
+
+
+class ReportRetention:
+    """
+    Retention policy for the reports table, applied in batches of users
+    so no single transaction locks a large part of the table.
+    """
+
+    @staticmethod
+    def compact_users(
+        conn: Connection,
+        user_ids: List[int],
+        keep: Optional[int] = None,
+        daily_days: Optional[int] = None,
+    ) -> Dict[str, int]:
+        row = conn.execute(text(COMPACT_SQL), {
+            "user_ids": user_ids,
+            "keep": keep if keep is not None else settings.REPORT_RETENTION_KEEP_LATEST,
+            "daily_days": daily_days if daily_days is not None else settings.REPORT_RETENTION_DAILY_DAYS,
+        }).one()
+        return {"snapshots": row.snapshots, "removed": row.removed}
+
+    @staticmethod
+    def compact(
+        engine: Engine,
+        keep: Optional[int] = None,
+        daily_days: Optional[int] = None,
+        batch_users: int = 500,
+    ) -> Dict[str, float]:
+        """
+        Compacts every user with more than `keep` reports of some type.
+        Returns counts, or skipped=1 if another process holds the lock.
+        """
+        keep = keep if keep is not None else settings.REPORT_RETENTION_KEEP_LATEST
+        started = time.perf_counter()
+        totals = {"users": 0, "snapshots": 0, "removed": 0}
+
+        with engine.connect() as lock_conn:
+            locked = lock_conn.execute(
+                text("SELECT pg_try_advisory_lock(:id)"), {"id": COMPACTION_LOCK_ID}
+            ).scalar()
+            if not locked:
+                return {**totals, "skipped": 1}
+
+            try:
+                user_ids = lock_conn.execute(text(
+                    "SELECT DISTINCT user_id FROM reports "
+                    "GROUP BY user_id, report_type HAVING count(*) > :keep "
+                    "ORDER BY user_id"
+                ), {"keep": keep}).scalars().all()
+                lock_conn.commit()
+
+                for start in range(0, len(user_ids), batch_users):
+                    batch = list(user_ids[start:start + batch_users])
+                    with engine.begin() as conn:
+                        counts = ReportRetention.compact_users(conn, batch, keep, daily_days)
+                    totals["users"] += len(batch)
+                    totals["snapshots"] += counts["snapshots"]
+                    totals["removed"] += counts["removed"]
+            finally:
+                lock_conn.execute(
+                    text("SELECT pg_advisory_unlock(:id)"), {"id": COMPACTION_LOCK_ID}
+                )
+                lock_conn.commit()
+
+        totals["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        logger.info("Report compaction: %s", totals)
+        return totals
+
+    @staticmethod
+    async def run_periodically(engine: Engine) -> None:
+        """
+        Background task started with the app: compacts every
+        REPORT_COMPACTION_INTERVAL_SECONDS in a worker thread.
+        """
+        while True:
+            await asyncio.sleep(settings.REPORT_COMPACTION_INTERVAL_SECONDS)
+            try:
+                await asyncio.to_thread(ReportRetention.compact, engine)
+            except Exception:
+                logger.exception("Report compaction failed")
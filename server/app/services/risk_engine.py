@@ -1,4 +1,35 @@
-from typing import Dict
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Thresholds shared by the per-user and batch scorers
+LOW_MARGIN_RISK = 0.05
+HIGH_DEBT_RISK = 0.6
+LOW_MARGIN_SCORE = 0.1
+HIGH_DEBT_SCORE = 0.5
+
+RISK_REASONS = ["Low profit margin", "High debt exposure", "Negative working capital"]
+
+# reasons for every combination of the three risk flags, indexed by the
+# bitmask low_margin | high_debt << 1 | negative_wc << 2
+REASON_COMBINATIONS = [
+    [reason for bit, reason in enumerate(RISK_REASONS) if code >> bit & 1]
+    for code in range(1 << len(RISK_REASONS))
+]
+
+_REASON_ARRAY = np.empty(len(REASON_COMBINATIONS), dtype=object)
+for _code, _reasons in enumerate(REASON_COMBINATIONS):
+    _REASON_ARRAY[_code] = _reasons
+
+BATCH_COLUMNS = ["profit_margin", "debt_to_revenue", "working_capital"]
+
+
+def metric_arrays(frame: pd.DataFrame) -> List[np.ndarray]:
+    missing = [c for c in BATCH_COLUMNS if c not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing metric columns: {', '.join(missing)}")
+    return [frame[c].to_numpy(dtype=np.float64) for c in BATCH_COLUMNS]
 
 
 class RiskEngine:
@@ -7,11 +38,11 @@ class RiskEngine:
         risk = "Low"
         reasons = []
 
-        if metrics["profit_margin"] < 0.05:
+        if metrics["profit_margin"] < LOW_MARGIN_RISK:
             risk = "Medium"
             reasons.append("Low profit margin")
 
-        if metrics["debt_to_revenue"] > 0.6:
+        if metrics["debt_to_revenue"] > HIGH_DEBT_RISK:
             risk = "High"
             reasons.append("High debt exposure")
 
@@ -28,11 +59,45 @@ class RiskEngine:
     def credit_score(metrics: Dict[str, float]) -> int:
         score = 750
 
-        if metrics["profit_margin"] < 0.1:
+        if metrics["profit_margin"] < LOW_MARGIN_SCORE:
             score -= 50
-        if metrics["debt_to_revenue"] > 0.5:
+        if metrics["debt_to_revenue"] > HIGH_DEBT_SCORE:
             score -= 100
         if metrics["working_capital"] < 0:
             score -= 100
 
         return max(score, 300)
+
+    @staticmethod
+    def assess_risk_batch(frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Column-wise assess_risk over a frame with profit_margin,
+        debt_to_revenue and working_capital. Returns risk_level and
+        reasons aligned with the input index.
+        """
+        margin, debt, wc = metric_arrays(frame)
+        low_margin = margin < LOW_MARGIN_RISK
+        high_risk = (debt > HIGH_DEBT_RISK) | (wc < 0)
+
+        risk_level = np.where(high_risk, "High", np.where(low_margin, "Medium", "Low"))
+
+        codes = (
+            low_margin.astype(np.int8)
+            | (debt > HIGH_DEBT_RISK).astype(np.int8) << 1
+            | (wc < 0).astype(np.int8) << 2
+        )
+        return pd.DataFrame(
+            {"risk_level": risk_level, "reasons": _REASON_ARRAY[codes]},
+            index=frame.index,
+        )
+
+    @staticmethod
+    def credit_score_batch(frame: pd.DataFrame) -> np.ndarray:
+        margin, debt, wc = metric_arrays(frame)
+        score = (
+            750
+            - 50 * (margin < LOW_MARGIN_SCORE)
+            - 100 * (debt > HIGH_DEBT_SCORE)
+            - 100 * (wc < 0)
+        )
+        return np.maximum(score, 300).astype(np.int64)
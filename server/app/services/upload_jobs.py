@@ -0,0 +1,203 @@
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.models.upload_job import UploadJob
+from app.services.file_parser import FileParser, FileTooLargeError
+from app.services.ingestion import IngestionService
+from app.utils.helpers import generate_uuid
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _init_worker() -> None:
+    # Connections inherited from the parent process must not be reused
+    engine.dispose(close=False)
+
+
+def _update_job(job_id: str, **fields) -> None:
+    db = SessionLocal()
+    try:
+        db.query(UploadJob).filter(UploadJob.id == job_id).update(fields)
+        db.commit()
+    finally:
+        db.close()
+
+
+def run_upload_job(job_id: str, path: str, filename: str, user_id: int) -> Dict:
+    """
+    Worker entry point: parses the spooled file chunk by chunk, inserts
+    it in a single transaction and records progress on the job row.
+    """
+    _update_job(job_id, status="running")
+    db = SessionLocal()
+    progress = {"rows_parsed": 0}
+
+    def count_parsed(chunks):
+        for chunk in chunks:
+            progress["rows_parsed"] += len(chunk)
+            _update_job(job_id, rows_parsed=progress["rows_parsed"])
+            yield chunk
+
+    try:
+        with open(path, "rb") as f:
+            chunks = FileParser.iter_chunks(
+                f, filename, chunk_rows=settings.UPLOAD_CHUNK_ROWS
+            )
+            stats = IngestionService.ingest_chunks(
+                db,
+                count_parsed(chunks),
+                user_id=user_id,
+                on_progress=lambda rows: _update_job(job_id, rows_inserted=rows),
+            )
+        db.commit()
+        _update_job(
+            job_id,
+            status="completed",
+            rows_rejected=stats["rows_rejected"],
+            validation_errors=stats["errors"],
+        )
+        return stats
+    except Exception as exc:
+        db.rollback()
+        logger.exception("Upload job %s failed", job_id)
+        _update_job(
+            job_id,
+            status="failed",
+            rows_inserted=0,
+            error=str(exc) or exc.__class__.__name__,
+        )
+        return {}
+    finally:
+        db.close()
+        Path(path).unlink(missing_ok=True)
+
+
+class UploadJobQueue:
+    _executor: Optional[Executor] = None
+
+    @classmethod
+    def executor(cls) -> Executor:
+        if cls._executor is None:
+            if settings.UPLOAD_JOB_EXECUTOR == "thread":
+                # In-process mode, useful for tests and single-process setups
+                cls._executor = ThreadPoolExecutor(max_workers=settings.UPLOAD_WORKERS)
+            else:
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=settings.UPLOAD_WORKERS,
+                    initializer=_init_worker,
+                )
+        return cls._executor
+
+    @staticmethod
+    def spool(fileobj: BinaryIO, job_id: str, filename: str) -> str:
+        spool_dir = Path(settings.UPLOAD_SPOOL_DIR)
+        spool_dir.mkdir(parents=True, exist_ok=True)
+
+        path = spool_dir / f"{job_id}{Path(filename).suffix}"
+        max_bytes = settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+        written = 0
+
+        with open(path, "wb") as out:
+            while True:
+                block = fileobj.read(1024 * 1024)
+                if not block:
+                    break
+                written += len(block)
+                if written > max_bytes:
+                    out.close()
+                    path.unlink(missing_ok=True)
+                    raise FileTooLargeError("File exceeds maximum upload size")
+                out.write(block)
+
+        return str(path)
+
+    @classmethod
+    def submit(cls, db, fileobj: BinaryIO, filename: str, user_id: int) -> UploadJob:
+        job_id = generate_uuid()
+        path = cls.spool(fileobj, job_id, filename)
+
+        job = UploadJob(
+            id=job_id,
+            user_id=user_id,
+            filename=filename,
+            status="queued",
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+        cls._enqueue(job_id, path, filename, user_id)
+        return job
+
+    @classmethod
+    def _enqueue(cls, job_id: str, path: str, filename: str, user_id: int) -> None:
+        future = cls.executor().submit(run_upload_job, job_id, path, filename, user_id)
+        future.add_done_callback(lambda f: cls._on_done(f, job_id, path))
+
+    @classmethod
+    def recover(cls) -> None:
+        """
+        Called at startup. Jobs still queued or running were lost with
+        the previous process's executor: they are re-submitted from their
+        spool file (ingestion runs in one transaction, so an interrupted
+        job left no rows behind), or marked failed if the file is gone.
+        Spool files without a pending job are deleted. Assumes a single
+        app process owns UPLOAD_SPOOL_DIR.
+        """
+        spool_dir = Path(settings.UPLOAD_SPOOL_DIR)
+        spooled = {path.stem: path for path in spool_dir.glob("*")} if spool_dir.is_dir() else {}
+
+        db = SessionLocal()
+        try:
+            jobs = (
+                db.query(UploadJob)
+                .filter(UploadJob.status.in_(["queued", "running"]))
+                .all()
+            )
+            pending = []
+            for job in jobs:
+                path = spooled.pop(job.id, None)
+                if path is None:
+                    job.status = "failed"
+                    job.error = "Interrupted by a server restart"
+                else:
+                    job.status = "queued"
+                    job.rows_parsed = 0
+                    job.rows_inserted = 0
+                    pending.append((job.id, str(path), job.filename, job.user_id))
+            db.commit()
+        finally:
+            db.close()
+
+        for path in spooled.values():
+            path.unlink(missing_ok=True)
+        for job in pending:
+            cls._enqueue(*job)
+
+        if jobs or spooled:
+            logger.info(
+                "Recovered upload jobs: %s re-queued, %s failed, %s orphaned spool files removed",
+                len(pending), len(jobs) - len(pending), len(spooled),
+            )
+
+    @staticmethod
+    def _on_done(future: Future, job_id: str, path: str) -> None:
+        # Only reached when the worker itself died (e.g. BrokenProcessPool)
+        exc = future.exception()
+        if exc is None:
+            return
+        logger.error("Upload job %s crashed: %s", job_id, exc)
+        _update_job(job_id, status="failed", error=str(exc) or exc.__class__.__name__)
+        if os.path.exists(path):
+            os.remove(path)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
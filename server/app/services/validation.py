@@ -0,0 +1,145 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Alternative headings found in accounting exports -> FinancialData columns
+COLUMN_ALIASES = {
+    "date": "record_date",
+    "txn_date": "record_date",
+    "transaction_date": "record_date",
+    "posting_date": "record_date",
+    "period": "record_date",
+    "sales": "revenue",
+    "total_sales": "revenue",
+    "turnover": "revenue",
+    "income": "revenue",
+    "credit": "revenue",
+    "expense": "expenses",
+    "costs": "expenses",
+    "total_expenses": "expenses",
+    "spend": "expenses",
+    "debit": "expenses",
+    "net_profit": "profit",
+    "receivables": "accounts_receivable",
+    "debtors": "accounts_receivable",
+    "ar": "accounts_receivable",
+    "payables": "accounts_payable",
+    "creditors": "accounts_payable",
+    "ap": "accounts_payable",
+    "inventory": "inventory_value",
+    "stock": "inventory_value",
+    "stock_value": "inventory_value",
+    "loans": "loan_obligations",
+    "loan_repayments": "loan_obligations",
+    "debt": "loan_obligations",
+    "tax": "tax_paid",
+    "taxes": "tax_paid",
+    "gst_paid": "tax_paid",
+}
+
+NUMERIC_COLUMNS = [
+    "revenue",
+    "expenses",
+    "profit",
+    "accounts_receivable",
+    "accounts_payable",
+    "inventory_value",
+    "loan_obligations",
+    "tax_paid",
+]
+
+# Currency symbols, thousands separators and whitespace in amount strings
+_AMOUNT_NOISE = r"[,\s₹$€£]"
+
+
+class UploadValidator:
+    """
+    Vectorized coercion and validation of a normalized upload chunk. Each
+    check is one array operation over the whole chunk; only rows that
+    fail are visited individually, to build the error report.
+    """
+
+    @staticmethod
+    def apply_aliases(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Renames alias headings, unless the canonical column is already
+        present (or claimed by an earlier alias).
+        """
+        present = set(df.columns)
+        renames = {}
+        for column in df.columns:
+            target = COLUMN_ALIASES.get(column)
+            if target and target not in present:
+                renames[column] = target
+                present.add(target)
+        return df.rename(columns=renames) if renames else df
+
+    @staticmethod
+    def coerce_dates(values: pd.Series) -> pd.Series:
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+        return pd.to_datetime(values, errors="coerce")
+
+    @staticmethod
+    def coerce_numbers(values: pd.Series) -> pd.Series:
+        if pd.api.types.is_numeric_dtype(values):
+            return values.astype(np.float64)
+
+        numbers = pd.to_numeric(values, errors="coerce")
+        numbers = pd.Series(
+            numbers.to_numpy(dtype=np.float64, na_value=np.nan), index=values.index
+        )
+
+        # Only values that failed plain parsing go through the (slower)
+        # cleanup of currency symbols and thousands separators
+        retry = numbers.isna() & values.notna()
+        if retry.any():
+            text = values[retry].astype(str).str.replace(_AMOUNT_NOISE, "", regex=True)
+            numbers[retry] = pd.to_numeric(text, errors="coerce")
+        return numbers
+
+    @staticmethod
+    def validate(
+        df: pd.DataFrame,
+        row_offset: int = 0,
+        max_errors: int = 100,
+    ) -> Tuple[pd.DataFrame, int, List[Dict]]:
+        """
+        Returns (valid rows with coerced types, number of rejected rows,
+        error report). Row numbers in the report are 1-based data rows
+        of the whole file, `row_offset` being the rows in earlier chunks.
+        At most `max_errors` rows are reported.
+        """
+        df = df.copy()
+        checks: List[Tuple[str, np.ndarray]] = []
+
+        dates = UploadValidator.coerce_dates(df["record_date"])
+        missing = df["record_date"].isna().to_numpy()
+        checks.append(("record_date: missing", missing))
+        checks.append(("record_date: not a valid date", dates.isna().to_numpy() & ~missing))
+        df["record_date"] = dates
+
+        for column in NUMERIC_COLUMNS:
+            if column not in df.columns:
+                continue
+            raw = df[column]
+            numbers = UploadValidator.coerce_numbers(raw)
+            values = numbers.to_numpy()
+            # Blank cells are allowed (they default later), garbage is not
+            checks.append((f"{column}: not a number", numbers.isna().to_numpy() & raw.notna().to_numpy()))
+            checks.append((f"{column}: not finite", np.isinf(values)))
+            df[column] = numbers
+
+        invalid = np.zeros(len(df), dtype=bool)
+        for _, mask in checks:
+            invalid |= mask
+
+        errors = []
+        for position in np.flatnonzero(invalid)[:max_errors]:
+            errors.append({
+                "row": row_offset + int(position) + 1,
+                "errors": [message for message, mask in checks if mask[position]],
+            })
+
+        return df[~invalid], int(invalid.sum()), errors
@@ -1,25 +1,62 @@
 from typing import Dict
 
+import numpy as np
+import pandas as pd
+
+from app.services.risk_engine import HIGH_DEBT_SCORE, LOW_MARGIN_SCORE, metric_arrays
+
+SUGGESTIONS = {
+    "liquidity": (
+        "Working capital is negative. Focus on faster collections "
+        "and negotiate longer payment terms with suppliers."
+    ),
+    "debt": (
+        "High debt burden detected. Avoid new loans and prioritize "
+        "repayment of high-interest credit."
+    ),
+    "margin": (
+        "Low profit margin. Review operating expenses and supplier contracts."
+    ),
+}
+
+# suggestions for every combination of the three flags, indexed by the
+# bitmask negative_wc | high_debt << 1 | low_margin << 2
+SUGGESTION_COMBINATIONS = [
+    {key: text for bit, (key, text) in enumerate(SUGGESTIONS.items()) if code >> bit & 1}
+    for code in range(1 << len(SUGGESTIONS))
+]
+
+_SUGGESTION_ARRAY = np.empty(len(SUGGESTION_COMBINATIONS), dtype=object)
+for _code, _suggestions in enumerate(SUGGESTION_COMBINATIONS):
+    _SUGGESTION_ARRAY[_code] = _suggestions
+
+
 class WorkingCapitalAdvisor:
     @staticmethod
     def suggest(metrics: Dict[str, float]) -> Dict[str, str]:
         suggestions = {}
 
         if metrics["working_capital"] < 0:
-            suggestions["liquidity"] = (
-                "Working capital is negative. Focus on faster collections "
-                "and negotiate longer payment terms with suppliers."
-            )
-
-        if metrics["debt_to_revenue"] > 0.5:
-            suggestions["debt"] = (
-                "High debt burden detected. Avoid new loans and prioritize "
-                "repayment of high-interest credit."
-            )
-
-        if metrics["profit_margin"] < 0.1:
-            suggestions["margin"] = (
-                "Low profit margin. Review operating expenses and supplier contracts."
-            )
+            suggestions["liquidity"] = SUGGESTIONS["liquidity"]
+
+        if metrics["debt_to_revenue"] > HIGH_DEBT_SCORE:
+            suggestions["debt"] = SUGGESTIONS["debt"]
+
+        if metrics["profit_margin"] < LOW_MARGIN_SCORE:
+            suggestions["margin"] = SUGGESTIONS["margin"]
 
         return suggestions
+
+    @staticmethod
+    def suggest_batch(frame: pd.DataFrame) -> pd.Series:
+        """
+        Column-wise suggest. Rows with the same flags share one
+        (read-only) suggestions dict.
+        """
+        margin, debt, wc = metric_arrays(frame)
+        codes = (
+            (wc < 0).astype(np.int8)
+            | (debt > HIGH_DEBT_SCORE).astype(np.int8) << 1
+            | (margin < LOW_MARGIN_SCORE).astype(np.int8) << 2
+        )
+        return pd.Series(_SUGGESTION_ARRAY[codes], index=frame.index, name="working_capital_suggestions")
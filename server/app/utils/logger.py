@@ -12,7 +12,7 @@ def setup_logger(name: str) -> logging.Logger:
     formatter = logging.Formatter(
         "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s"
     )
-a
+
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
 
@@ -0,0 +1,59 @@
+"""
+Expense categorization: per-row Python classify (previous
+implementation) vs. the compiled ExpenseMatcher.
+
+    python -m benchmarks.bench_categorization [--rows 100000 1000000]
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import report, timer
+
+from app.services.bookkeeping import BookkeepingService, EXPENSE_RULES
+
+
+def classify_apply(df: pd.DataFrame) -> pd.Series:
+    def classify(desc: str) -> str:
+        desc = str(desc).lower()
+        for category, keywords in EXPENSE_RULES.items():
+            if any(k in desc for k in keywords):
+                return category
+        return "other"
+
+    return df["description"].apply(classify)
+
+
+def make_descriptions(rows: int, distinct: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    words = [k for keywords in EXPENSE_RULES.values() for k in keywords]
+    words += ["misc", "refund", "transfer", "invoice", "payment", "card"]
+    vocab = [
+        f"{rng.choice(words).upper()} {rng.choice(words)} ref {i}"
+        for i in range(distinct)
+    ]
+    return pd.DataFrame({"description": rng.choice(vocab, size=rows)})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", nargs="+", type=int, default=[100_000, 1_000_000])
+    parser.add_argument("--distinct", type=int, default=50_000)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        df = make_descriptions(rows, min(args.distinct, rows))
+        results = {}
+
+        with timer(results, "per-row apply(classify)"):
+            expected = classify_apply(df)
+        with timer(results, "ExpenseMatcher"):
+            actual = BookkeepingService.categorize_expenses(df.copy())["expense_category"]
+
+        assert (expected == actual).all()
+        report(f"{rows:,} descriptions ({min(args.distinct, rows):,} distinct)", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Compares the old ORM + `r.__dict__` DataFrame construction with
+FinancialDataLoader at 10k/100k/1M rows.
+
+    python -m benchmarks.bench_data_loader [--database-url URL] [--sizes 10000 100000]
+
+Defaults to an in-memory SQLite database.
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import report, timer
+
+from sqlalchemy import create_engine, delete, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.user import User
+from app.models.financial_data import FinancialData
+from app.services.data_access import FinancialDataLoader
+
+
+def seed(session, rows: int) -> None:
+    session.execute(delete(FinancialData))
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2000-01-01", periods=rows, freq="h").date
+    batch = [
+        {
+            "user_id": 1,
+            "record_date": dates[i],
+            "revenue": float(v),
+            "expenses": float(v) * 0.8,
+            "profit": float(v) * 0.2,
+            "accounts_receivable": 10.0,
+            "accounts_payable": 5.0,
+            "inventory_value": None,
+            "loan_obligations": 1.0,
+            "tax_paid": 2.0,
+            "source": "bench",
+        }
+        for i, v in enumerate(rng.uniform(1000, 5000, rows))
+    ]
+    session.execute(insert(FinancialData), batch)
+    session.commit()
+
+
+def orm_path(session) -> pd.DataFrame:
+    records = session.query(FinancialData).filter(FinancialData.user_id == 1).all()
+    return pd.DataFrame(
+        [{k: v for k, v in r.__dict__.items() if not k.startswith("_")} for r in records]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url", default="sqlite://")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(engine, tables=[User.__table__, FinancialData.__table__])
+    Session = sessionmaker(bind=engine)
+
+    with Session() as session:
+        if session.get(User, 1) is None:
+            session.add(User(id=1, email="bench@example.com", hashed_password="x"))
+            session.commit()
+
+    for rows in args.sizes:
+        results = {}
+        with Session() as session:
+            seed(session, rows)
+
+        with Session() as session, timer(results, "ORM entities + r.__dict__"):
+            orm_path(session)
+        with Session() as session, timer(results, "FinancialDataLoader (all columns)"):
+            FinancialDataLoader.load_frame(session, 1)
+        with Session() as session, timer(results, "FinancialDataLoader (3 columns)"):
+            FinancialDataLoader.load_frame(
+                session, 1, columns=["record_date", "revenue", "expenses"]
+            )
+
+        report(f"{rows:,} rows", results)
+
+
+if __name__ == "__main__":
+    main()
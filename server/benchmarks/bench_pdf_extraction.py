@@ -0,0 +1,133 @@
+"""
+PDF statement extraction: the original serial extract_text parser vs.
+PdfStatementExtractor serially, across a process pool, and from the
+page cache, on a generated multi-page bank statement.
+
+    python -m benchmarks.bench_pdf_extraction [--pages 500] [--workers 4]
+"""
+import argparse
+import tempfile
+from datetime import date, timedelta
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from PyPDF2 import PdfReader
+
+from benchmarks.common import report, timer
+
+from app.core.config import settings
+from app.services.pdf_extractor import PdfStatementExtractor
+
+# Column x positions (points) of the generated statement
+COLUMNS = [("Date", 40), ("Description", 110), ("Debit", 330), ("Credit", 410), ("Balance", 490)]
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_statement_pdf(pages: int, rows_per_page: int = 40) -> bytes:
+    """
+    Minimal hand-written PDF (no extra dependency): one Helvetica text
+    object per cell, like most bank statement generators emit.
+    """
+    rng = np.random.default_rng(0)
+    day = date(2023, 1, 1)
+    balance = 100000.0
+
+    streams = []
+    for page in range(pages):
+        ops = [f"BT /F1 12 Tf 40 800 Td (Statement of account - page {page + 1}) Tj ET"]
+        y = 770
+        for title, x in COLUMNS:
+            ops.append(f"BT /F1 9 Tf {x} {y} Td ({title}) Tj ET")
+        for _ in range(rows_per_page):
+            y -= 18
+            debit, credit = (round(rng.uniform(10, 5000), 2), None) if rng.random() < 0.6 \
+                else (None, round(rng.uniform(10, 8000), 2))
+            balance += (credit or 0) - (debit or 0)
+            cells = [
+                day.strftime("%d/%m/%Y"),
+                f"UPI/{rng.integers(10**9)}/Payment ref",
+                f"{debit:,.2f}" if debit else "",
+                f"{credit:,.2f}" if credit else "",
+                f"{balance:,.2f}",
+            ]
+            for (_, x), text in zip(COLUMNS, cells):
+                if text:
+                    ops.append(f"BT /F1 9 Tf {x} {y} Td ({_escape(text)}) Tj ET")
+            day += timedelta(days=int(rng.integers(0, 2)))
+        ops.append(f"BT /F1 8 Tf 40 30 Td (Page {page + 1} of {pages}) Tj ET")
+        streams.append("\n".join(ops).encode())
+
+    # Objects: 1 catalog, 2 pages, 3 font, then (page, content) pairs
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for stream in streams:
+        page_id, content_id = len(objects) + 1, len(objects) + 2
+        kids.append(f"{page_id} 0 R")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    out = BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def parse_pdf_original(file_bytes: bytes) -> pd.DataFrame:
+    reader = PdfReader(BytesIO(file_bytes))
+    text = "\n".join(page.extract_text() or "" for page in reader.pages)
+    rows = [line.split() for line in text.splitlines() if len(line.split()) >= 2]
+    return pd.DataFrame(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--rows-per-page", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    file_bytes = make_statement_pdf(args.pages, args.rows_per_page)
+    settings.PDF_CACHE_DIR = tempfile.mkdtemp(prefix="bench_pdf_cache_")
+    results = {}
+
+    with timer(results, "original extract_text + split"):
+        parse_pdf_original(file_bytes)
+    with timer(results, "extractor, 1 process"):
+        serial = PdfStatementExtractor.extract(file_bytes, workers=1, use_cache=False)
+    with timer(results, f"extractor, {args.workers} processes"):
+        parallel = PdfStatementExtractor.extract(file_bytes, workers=args.workers, use_cache=True)
+    with timer(results, "extractor, page cache hit"):
+        cached = PdfStatementExtractor.extract(file_bytes, workers=args.workers, use_cache=True)
+
+    assert len(serial) == args.pages * args.rows_per_page, len(serial)
+    pd.testing.assert_frame_equal(serial, parallel)
+    pd.testing.assert_frame_equal(serial, cached)
+    report(
+        f"{args.pages} pages, {len(serial):,} transactions ({len(file_bytes) / 1e6:.1f} MB)",
+        results,
+    )
+    print(serial.dtypes.to_string())
+
+
+if __name__ == "__main__":
+    main()
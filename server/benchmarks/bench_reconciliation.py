@@ -0,0 +1,89 @@
+"""
+Reconciliation of synthetic bank/books ledgers with duplicates, small
+amount differences and posting-date lags, plus a ledger of repeated
+equal amounts posted a day late and a cent off. Every entry of the
+latter has a partner; the few left unmatched lost theirs to a cheaper
+pair (same day or same amount) from a neighbouring key, since matching
+is greedy cheapest-first.
+
+    python -m benchmarks.bench_reconciliation [--rows 100000 1000000]
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import report, timer
+
+from app.services.reconciliation import ReconciliationEngine
+
+
+def make_ledgers(rows: int):
+    rng = np.random.default_rng(0)
+    dates = pd.Timestamp("2023-01-01") + pd.to_timedelta(rng.integers(0, 365, rows), unit="D")
+    amounts = np.round(rng.choice(np.arange(1, 5000), rows) + rng.integers(0, 100, rows) / 100, 2)
+    bank = pd.DataFrame({"record_date": dates, "amount": amounts})
+
+    books = bank.sample(frac=0.95, random_state=1).reset_index(drop=True)
+    lagged = rng.random(len(books)) < 0.1
+    books.loc[lagged, "record_date"] += pd.to_timedelta(rng.integers(1, 3, lagged.sum()), unit="D")
+    rounded = rng.random(len(books)) < 0.05
+    books.loc[rounded, "amount"] = books.loc[rounded, "amount"].round(0)
+    return bank, books
+
+
+def make_duplicate_ledgers(rows: int, repeats: int = 50):
+    """
+    `repeats` bank entries per (day, amount), each booked one day later
+    and 0.01 higher.
+    """
+    keys = rows // repeats
+    rng = np.random.default_rng(2)
+    dates = pd.Timestamp("2023-01-01") + pd.to_timedelta(rng.integers(0, 365, keys), unit="D")
+    amounts = np.round(rng.integers(100, 100_000, keys) / 100, 2)
+    bank = pd.DataFrame({
+        "record_date": np.repeat(dates, repeats),
+        "amount": np.repeat(amounts, repeats),
+    })
+    books = pd.DataFrame({
+        "record_date": bank["record_date"] + pd.Timedelta(days=1),
+        "amount": bank["amount"] + 0.01,
+    })
+    return bank, books
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", nargs="+", type=int, default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        bank, books = make_ledgers(rows)
+        results = {}
+
+        with timer(results, "exact only"):
+            exact, _, _ = ReconciliationEngine.match(bank, books)
+        with timer(results, "3-day window, 1.00 tolerance"):
+            fuzzy, _, _ = ReconciliationEngine.match(
+                bank, books, date_window_days=3, amount_tolerance=1.0
+            )
+
+        report(
+            f"{rows:,} bank rows: {len(exact):,} exact, {len(fuzzy):,} with tolerance",
+            results,
+        )
+
+        bank, books = make_duplicate_ledgers(rows)
+        results = {}
+        with timer(results, "1-day window, 0.01 tolerance"):
+            pairs, _, _ = ReconciliationEngine.match(
+                bank, books, date_window_days=1, amount_tolerance=0.01
+            )
+        report(
+            f"{len(bank):,} repeated bank rows: {len(pairs):,} matched",
+            results,
+        )
+
+
+if __name__ == "__main__":
+    main()
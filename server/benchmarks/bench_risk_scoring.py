@@ -0,0 +1,65 @@
+"""
+Portfolio scoring: per-row RiskEngine / WorkingCapitalAdvisor calls vs.
+the column-wise batch variants.
+
+    python -m benchmarks.bench_risk_scoring [--rows 100000 1000000]
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import report, timer
+
+from app.services.risk_engine import RiskEngine
+from app.services.working_capital import WorkingCapitalAdvisor
+
+
+def make_metrics(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "profit_margin": rng.normal(0.1, 0.1, rows).round(4),
+        "debt_to_revenue": rng.gamma(2.0, 0.25, rows).round(4),
+        "working_capital": rng.normal(50_000, 80_000, rows).round(2),
+    })
+
+
+def score_rows(df: pd.DataFrame):
+    records = df.to_dict("records")
+    risks = [RiskEngine.assess_risk(m) for m in records]
+    scores = [RiskEngine.credit_score(m) for m in records]
+    suggestions = [WorkingCapitalAdvisor.suggest(m) for m in records]
+    return risks, scores, suggestions
+
+
+def score_batch(df: pd.DataFrame):
+    return (
+        RiskEngine.assess_risk_batch(df),
+        RiskEngine.credit_score_batch(df),
+        WorkingCapitalAdvisor.suggest_batch(df),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", nargs="+", type=int, default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        df = make_metrics(rows)
+        results = {}
+
+        with timer(results, "per-row assess/score/suggest"):
+            risks, scores, suggestions = score_rows(df)
+        with timer(results, "batch (NumPy masks)"):
+            risk, score, suggested = score_batch(df)
+
+        assert risk["risk_level"].tolist() == [r["risk_level"] for r in risks]
+        assert risk["reasons"].tolist() == [r["reasons"] for r in risks]
+        assert score.tolist() == scores
+        assert suggested.tolist() == suggestions
+        report(f"{rows:,} businesses", results)
+
+
+if __name__ == "__main__":
+    main()
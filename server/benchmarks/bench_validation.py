@@ -0,0 +1,80 @@
+"""
+Upload validation: a per-row Python check vs. the vectorized
+UploadValidator, on frames read back from a generated CSV in which a
+fraction of dates and revenue values are malformed.
+
+    python -m benchmarks.bench_validation [--rows 100000 1000000]
+"""
+import argparse
+import math
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import report, timer
+
+from app.services.validation import NUMERIC_COLUMNS, UploadValidator
+
+
+def make_frame(rows: int, bad_fraction: float) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2015-01-01", periods=rows, freq="min").strftime("%Y-%m-%d")
+    df = pd.DataFrame({"record_date": np.asarray(dates, dtype=object)})
+    for column in NUMERIC_COLUMNS:
+        df[column] = rng.uniform(0, 10_000, rows).round(2)
+
+    df["revenue"] = df["revenue"].astype(object)
+    df.loc[rng.random(rows) < bad_fraction, "revenue"] = "unknown"
+    df.loc[rng.random(rows) < bad_fraction, "revenue"] = "1,234.50"  # valid
+    df.loc[rng.random(rows) < bad_fraction, "record_date"] = "31/02/2020"
+
+    buffer = StringIO()
+    df.to_csv(buffer, index=False)
+    buffer.seek(0)
+    return pd.read_csv(buffer)
+
+
+def validate_rows(df: pd.DataFrame) -> int:
+    rejected = 0
+    for record in df.to_dict("records"):
+        ok = True
+        try:
+            pd.Timestamp(record["record_date"])
+        except ValueError:
+            ok = False
+        for column in NUMERIC_COLUMNS:
+            value = record[column]
+            if isinstance(value, str):
+                value = value.replace(",", "")
+            try:
+                if not math.isfinite(float(value)):
+                    ok = False
+            except (TypeError, ValueError):
+                ok = False
+        rejected += not ok
+    return rejected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", nargs="+", type=int, default=[100_000, 1_000_000])
+    parser.add_argument("--bad-fraction", type=float, default=0.01)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        df = make_frame(rows, args.bad_fraction)
+        results = {}
+
+        with timer(results, "per-row Python checks"):
+            expected = validate_rows(df)
+        with timer(results, "UploadValidator.validate"):
+            valid, rejected, errors = UploadValidator.validate(df)
+
+        assert rejected == expected, (rejected, expected)
+        assert len(valid) + rejected == rows
+        report(f"{rows:,} rows, {rejected:,} rejected", results)
+
+
+if __name__ == "__main__":
+    main()
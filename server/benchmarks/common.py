@@ -0,0 +1,43 @@
+"""
+Shared helpers for the scripts in this directory.
+
+Run benchmarks from the server directory, e.g.
+    python -m benchmarks.bench_data_loader
+"""
+import os
+import time
+from contextlib import contextmanager
+
+# Settings are required at import time; provide harmless defaults so
+# benchmarks that don't need the real database can run without a .env.
+BENCH_ENV = {
+    "APP_NAME": "bench",
+    "ENV": "bench",
+    "SECRET_KEY": "bench",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "60",
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "postgres",
+    "POSTGRES_DB": "sme_finance",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "API_KEY": "",
+    "MODEL": "bench",
+    "ALLOWED_ORIGINS": "*",
+}
+
+for key, value in BENCH_ENV.items():
+    os.environ.setdefault(key, value)
+
+
+@contextmanager
+def timer(results: dict, label: str):
+    started = time.perf_counter()
+    yield
+    results[label] = time.perf_counter() - started
+
+
+def report(title: str, results: dict) -> None:
+    print(f"\n{title}")
+    for label, seconds in results.items():
+        print(f"  {label:<40} {seconds * 1000:>10.1f} ms")
@@ -0,0 +1,73 @@
+"""
+Concurrent load test for POST /api/ai/financial-health.
+
+Start the API against the stub provider (see stub_ai_provider.py) with
+AI_CACHE_ENABLED=false so every request reaches the provider, then:
+
+    python -m benchmarks.load_ai_endpoint --token <JWT> --concurrency 50 --requests 500
+
+Reports requests/sec and latency percentiles. Run it once against the
+sync-Session version and once against the async one to compare.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def worker(client, url, headers, queue, latencies, errors):
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+
+        started = time.perf_counter()
+        try:
+            response = await client.post(url, headers=headers)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError as exc:
+            errors.append(type(exc).__name__)
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(args) -> None:
+    queue = asyncio.Queue()
+    for i in range(args.requests):
+        queue.put_nowait(i)
+
+    url = f"{args.base_url}/api/ai/financial-health"
+    headers = {"Authorization": f"Bearer {args.token}"}
+    latencies, errors = [], []
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(timeout=300, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            worker(client, url, headers, queue, latencies, errors)
+            for _ in range(args.concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"requests:     {len(latencies)} ({len(errors)} errors)")
+    print(f"elapsed:      {elapsed:.2f} s")
+    print(f"throughput:   {len(latencies) / elapsed:.1f} req/s")
+    print(f"latency p50:  {statistics.median(latencies) * 1000:.0f} ms")
+    print(f"latency p95:  {latencies[int(len(latencies) * 0.95) - 1] * 1000:.0f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
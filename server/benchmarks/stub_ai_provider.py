@@ -0,0 +1,46 @@
+"""
+Local stand-in for the OpenAI-compatible chat completions API, used to
+load-test the AI endpoints without calling the real provider.
+
+    uvicorn benchmarks.stub_ai_provider:app --port 9100
+    AI_API_URL=http://localhost:9100/v1/chat/completions uvicorn main:app
+
+STUB_LATENCY_SECONDS controls the simulated generation time and
+STUB_ERROR_RATE the share of requests answered with a 503.
+"""
+import asyncio
+import json
+import os
+import random
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+LATENCY = float(os.getenv("STUB_LATENCY_SECONDS", "2.0"))
+ERROR_RATE = float(os.getenv("STUB_ERROR_RATE", "0.0"))
+TOKENS = ("Your business shows stable revenue with moderate debt. " * 4).split(" ")
+
+app = FastAPI()
+
+
+@app.post("/v1/chat/completions")
+async def completions(request: Request):
+    body = await request.json()
+
+    if random.random() < ERROR_RATE:
+        return JSONResponse({"error": "overloaded"}, status_code=503)
+
+    if body.get("stream"):
+        async def events():
+            for token in TOKENS:
+                await asyncio.sleep(LATENCY / len(TOKENS))
+                chunk = {"choices": [{"delta": {"content": token + " "}}]}
+                yield f"data: {json.dumps(chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    await asyncio.sleep(LATENCY)
+    return {
+        "choices": [{"message": {"role": "assistant", "content": " ".join(TOKENS)}}],
+    }
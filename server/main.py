@@ -1,11 +1,19 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.database import engine, async_engine, Base
+from app.core.migrations import run_migrations
+from app.services.upload_jobs import UploadJobQueue
+from app.ai.claude_client import claude_client
+from app.services.benchmarking import BenchmarkingService
+from app.services.bookkeeping import BookkeepingService
+from app.services.report_retention import ReportRetention
 
 # Routers
-from app.routers import health,auth, upload, analysis, ai, reports, banking_mock, gst_mock, compliance, forecast
+from app.routers import health,auth, upload, analysis, ai, reports, banking_mock, gst_mock, compliance, forecast, reconciliation, financial_data
 
 
 def create_app() -> FastAPI:
@@ -23,6 +31,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", "X-Next-Cursor"],
     )
 
     # Routers
@@ -36,6 +45,8 @@ def create_app() -> FastAPI:
     app.include_router(banking_mock.router, prefix="/api/banking", tags=["Banking"])
     app.include_router(gst_mock.router, prefix="/api/gst", tags=["GST"])
     app.include_router(forecast.router, prefix="/api/forecast", tags=["Forecast"])
+    app.include_router(reconciliation.router, prefix="/api/reconciliation", tags=["Reconciliation"])
+    app.include_router(financial_data.router, prefix="/api/financial-data", tags=["Financial Data"])
 
 
     return app
@@ -47,3 +58,41 @@ app = create_app()
 @app.on_event("startup")
 def startup():
     Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+    UploadJobQueue.recover()
+    BenchmarkingService.reload()
+
+    if settings.EXPENSE_RULES_FILE:
+        BookkeepingService.load_rules(settings.EXPENSE_RULES_FILE)
+
+
+@app.on_event("startup")
+async def start_ai_client():
+    await claude_client.startup()
+
+
+@app.on_event("startup")
+async def start_report_compaction():
+    if settings.REPORT_COMPACTION_ENABLED:
+        app.state.compaction_task = asyncio.create_task(
+            ReportRetention.run_periodically(engine)
+        )
+
+
+@app.on_event("shutdown")
+def shutdown():
+    UploadJobQueue.shutdown()
+
+
+@app.on_event("shutdown")
+async def stop_report_compaction():
+    task = getattr(app.state, "compaction_task", None)
+    if task is not None:
+        task.cancel()
+
+
+@app.on_event("shutdown")
+async def stop_ai_client():
+    await claude_client.shutdown()
+    await async_engine.dispose()
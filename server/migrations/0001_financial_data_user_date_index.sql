@@ -0,0 +1,4 @@
+-- Every router filters financial_data by user_id, forecasting also
+-- orders by record_date.
+CREATE INDEX IF NOT EXISTS ix_financial_data_user_date
+    ON financial_data (user_id, record_date);
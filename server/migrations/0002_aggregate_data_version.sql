@@ -0,0 +1,2 @@
+ALTER TABLE user_financial_aggregates
+    ADD COLUMN IF NOT EXISTS data_version INTEGER NOT NULL DEFAULT 0;
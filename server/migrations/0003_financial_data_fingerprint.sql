@@ -0,0 +1,6 @@
+-- Rows ingested before this migration keep a NULL fingerprint and are
+-- not deduplicated against (NULLs never conflict in a unique index).
+ALTER TABLE financial_data ADD COLUMN IF NOT EXISTS fingerprint BIGINT;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_financial_data_user_fingerprint
+    ON financial_data (user_id, record_date, fingerprint);
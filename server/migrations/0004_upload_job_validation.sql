@@ -0,0 +1,3 @@
+-- Rows skipped by upload validation and the report of the first ones
+ALTER TABLE upload_jobs ADD COLUMN IF NOT EXISTS rows_rejected INTEGER DEFAULT 0;
+ALTER TABLE upload_jobs ADD COLUMN IF NOT EXISTS validation_errors JSON;
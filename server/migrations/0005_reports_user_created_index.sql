@@ -0,0 +1,4 @@
+-- The reports list filters by user_id and pages newest-first on
+-- (created_at, id).
+CREATE INDEX IF NOT EXISTS ix_reports_user_created
+    ON reports (user_id, created_at, id);
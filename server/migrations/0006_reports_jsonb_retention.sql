@@ -0,0 +1,23 @@
+-- JSONB is stored decomposed (no re-parsing on read, duplicate keys
+-- dropped) and can be indexed.
+ALTER TABLE reports
+    ALTER COLUMN metrics TYPE JSONB USING metrics::jsonb,
+    ALTER COLUMN ai_insights TYPE JSONB USING ai_insights::jsonb;
+
+-- Containment lookups on metrics, e.g. forecast reports by model:
+--   metrics @> '{"details": {"series": {"revenue": {"model": "holt_winters"}}}}'
+-- (risk_level lives in ai_insights->'risk', which is not indexed)
+CREATE INDEX IF NOT EXISTS ix_reports_metrics_gin
+    ON reports USING GIN (metrics jsonb_path_ops);
+
+-- Range filters and sorting on the most queried analysis metrics
+CREATE INDEX IF NOT EXISTS ix_reports_profit_margin
+    ON reports (((metrics->>'profit_margin')::double precision))
+    WHERE report_type = 'analysis';
+CREATE INDEX IF NOT EXISTS ix_reports_debt_to_revenue
+    ON reports (((metrics->>'debt_to_revenue')::double precision))
+    WHERE report_type = 'analysis';
+
+-- Retention compaction
+ALTER TABLE reports ADD COLUMN IF NOT EXISTS snapshot VARCHAR;
+ALTER TABLE reports ADD COLUMN IF NOT EXISTS snapshot_count INTEGER;
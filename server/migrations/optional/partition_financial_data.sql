@@ -0,0 +1,64 @@
+-- Optional: converts financial_data into a table range-partitioned by
+-- record_date (one partition per year). Not applied automatically.
+--
+--   psql "$DATABASE_URL" -f migrations/optional/partition_financial_data.sql
+--
+-- Then set FINANCIAL_DATA_PARTITIONED=true so startup keeps creating
+-- partitions around the current year (FINANCIAL_DATA_PARTITION_GRANULARITY
+-- = year | quarter). Rows outside any partition land in
+-- financial_data_default.
+--
+-- The primary key becomes (id, record_date) since unique constraints on a
+-- partitioned table must include the partition key.
+
+BEGIN;
+
+LOCK TABLE financial_data IN ACCESS EXCLUSIVE MODE;
+
+ALTER TABLE financial_data RENAME TO financial_data_unpartitioned;
+ALTER INDEX IF EXISTS ix_financial_data_user_date
+    RENAME TO ix_financial_data_unpartitioned_user_date;
+ALTER INDEX IF EXISTS ux_financial_data_user_fingerprint
+    RENAME TO ux_financial_data_unpartitioned_user_fingerprint;
+
+CREATE TABLE financial_data (
+    LIKE financial_data_unpartitioned INCLUDING DEFAULTS
+) PARTITION BY RANGE (record_date);
+
+ALTER TABLE financial_data ADD PRIMARY KEY (id, record_date);
+ALTER TABLE financial_data
+    ADD CONSTRAINT financial_data_partitioned_user_id_fkey
+    FOREIGN KEY (user_id) REFERENCES users (id);
+CREATE INDEX ix_financial_data_user_date ON financial_data (user_id, record_date);
+-- Conflict target of ingestion's ON CONFLICT (see 0003); it includes
+-- record_date, so it is allowed on the partitioned table
+CREATE UNIQUE INDEX ux_financial_data_user_fingerprint
+    ON financial_data (user_id, record_date, fingerprint);
+
+DO $$
+DECLARE
+    first_year int;
+    last_year int;
+BEGIN
+    SELECT COALESCE(EXTRACT(YEAR FROM MIN(record_date))::int, EXTRACT(YEAR FROM now())::int),
+           GREATEST(COALESCE(EXTRACT(YEAR FROM MAX(record_date))::int, 0), EXTRACT(YEAR FROM now())::int + 1)
+      INTO first_year, last_year
+      FROM financial_data_unpartitioned;
+
+    FOR y IN first_year..last_year LOOP
+        EXECUTE format(
+            'CREATE TABLE financial_data_y%s PARTITION OF financial_data '
+            'FOR VALUES FROM (%L) TO (%L)',
+            y, make_date(y, 1, 1), make_date(y + 1, 1, 1)
+        );
+    END LOOP;
+END $$;
+
+CREATE TABLE financial_data_default PARTITION OF financial_data DEFAULT;
+
+INSERT INTO financial_data SELECT * FROM financial_data_unpartitioned;
+
+ALTER SEQUENCE financial_data_id_seq OWNED BY financial_data.id;
+DROP TABLE financial_data_unpartitioned;
+
+COMMIT;